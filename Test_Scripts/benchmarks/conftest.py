@@ -0,0 +1,59 @@
+# benchmarks/conftest.py
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from framework.benchmark import get_plugin, measure
+from framework.stubs import StubPage
+
+
+@pytest.fixture
+def bench(request):
+    """
+    Times a callable and records the result under the test's name (or 'name'):
+        bench(lambda: LoginPage(page))
+    """
+    plugin = get_plugin(request.config)
+
+    def run(func, name=None, **options):
+        result = measure(func, **options)
+        plugin.record(name or request.node.name, result)
+        return result
+
+    return run
+
+
+@pytest.fixture
+def stub_page():
+    """Local stand-in for a Playwright Page: building locators costs no browser round trip."""
+    return StubPage()
+
+
+class _PostsHandler(BaseHTTPRequestHandler):
+    """Serves /posts/<id> like JSONPlaceholder does, from memory."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        post_id = int(self.path.rsplit("/", 1)[-1])
+        body = json.dumps({"userId": 1, "id": post_id, "title": f"post {post_id}", "body": "stub"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def stub_api_url():
+    """Base URL of a local JSONPlaceholder stand-in, so API benchmarks don't measure the internet."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PostsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
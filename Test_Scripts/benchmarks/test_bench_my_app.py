@@ -0,0 +1,15 @@
+# benchmarks/test_bench_my_app.py
+import pytest
+
+import my_app
+
+pytestmark = pytest.mark.bench
+
+
+def test_fetch_post_title(bench, stub_api_url):
+    """
+    my_app.fetch_post_title against a local stub: requests overhead plus a loopback round trip.
+    Its DEBUG print is part of the cost; run with pytest's default capture, not -s.
+    """
+    assert my_app.fetch_post_title(1, base_url=stub_api_url) == "post 1"
+    bench(lambda: my_app.fetch_post_title(1, base_url=stub_api_url), repeat=10)
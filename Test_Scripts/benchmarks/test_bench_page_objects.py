@@ -0,0 +1,17 @@
+# benchmarks/test_bench_page_objects.py
+import pytest
+
+from pages.async_login_page import AsyncLoginPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+pytestmark = pytest.mark.bench
+
+
+@pytest.mark.parametrize("page_class", [LoginPage, InventoryPage, CartPage, CheckoutPage, AsyncLoginPage],
+                         ids=lambda page_class: page_class.__name__)
+def test_page_object_construction(bench, stub_page, page_class):
+    """Cost of building a page object and all of its locators."""
+    bench(lambda: page_class(stub_page))
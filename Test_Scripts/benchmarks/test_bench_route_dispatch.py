@@ -0,0 +1,37 @@
+# benchmarks/test_bench_route_dispatch.py
+import re
+from fnmatch import fnmatch
+
+import pytest
+
+from framework.mock_bank import MockBank, MockSession
+from framework.stubs import FakeRoute
+
+pytestmark = pytest.mark.bench
+
+API = "http://localhost:8000/api"
+RESOURCES = [f"resource{number}" for number in range(50)]
+ENTRIES = ([{"method": "GET", "url": f"{API}/{resource}", "body": "{}"} for resource in RESOURCES]
+           + [{"method": "GET", "url": f"{API}/{resource}/{{id}}", "body": "{}"} for resource in RESOURCES])
+URLS = [f"{API}/resource49", f"{API}/resource25/123", "https://www.saucedemo.com/static/js/main.js"]
+
+
+@pytest.mark.parametrize("url", URLS, ids=["exact", "templated", "miss"])
+def test_mock_bank_dispatch(bench, url):
+    """One request through the mock bank's index (100 mocks)."""
+    session = MockSession(MockBank(ENTRIES))
+    route = FakeRoute("GET", url)
+    bench(lambda: session.handle(route))
+
+
+@pytest.mark.parametrize("url", URLS, ids=["exact", "templated", "miss"])
+def test_glob_per_route_dispatch(bench, url):
+    """Baseline: one glob per mocked endpoint, tried in turn like one page.route() per mock."""
+    globs = [entry["url"].replace("{id}", "*") for entry in ENTRIES]
+    bench(lambda: next((pattern for pattern in globs if fnmatch(url, pattern)), None))
+
+
+def test_precompiled_regex_dispatch(bench):
+    """Baseline: the same globs precompiled to regexes, still scanned linearly (worst case: a miss)."""
+    patterns = [re.compile(re.escape(entry["url"]).replace(r"\{id\}", "[^/]+") + "$") for entry in ENTRIES]
+    bench(lambda: next((pattern for pattern in patterns if pattern.match(URLS[2])), None))
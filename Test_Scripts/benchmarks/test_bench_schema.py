@@ -0,0 +1,33 @@
+# benchmarks/test_bench_schema.py
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft7Validator, validate
+
+pytestmark = pytest.mark.bench
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "post_schema.json"
+POST = {"userId": 1, "id": 1, "title": "sunt aut facere", "body": "quia et suscipit"}
+
+
+def _load_schema():
+    with open(SCHEMA_PATH, "r") as file:
+        return json.load(file)
+
+
+def test_schema_load(bench):
+    """Reading and parsing post_schema.json from disk."""
+    bench(_load_schema)
+
+
+def test_schema_validate(bench):
+    """jsonschema.validate as the API tests call it: checks the schema and builds a validator every call."""
+    schema = _load_schema()
+    bench(lambda: validate(instance=POST, schema=schema))
+
+
+def test_schema_validate_precompiled(bench):
+    """Validating with a validator built once, for comparison with test_schema_validate."""
+    validator = Draft7Validator(_load_schema())
+    bench(lambda: validator.validate(POST))
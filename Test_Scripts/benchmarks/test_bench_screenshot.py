@@ -0,0 +1,25 @@
+# benchmarks/test_bench_screenshot.py
+import base64
+import hashlib
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page
+
+pytestmark = pytest.mark.bench
+
+# A screenshot the suite already produces, used as the sample for the encode/hash step
+SAMPLE_SCREENSHOT = Path(__file__).parent.parent / "intro_page.png"
+
+
+def test_screenshot_encode(bench):
+    """Base64 encoding plus the SHA-256 the Allure store uses to de-duplicate attachments."""
+    screenshot = SAMPLE_SCREENSHOT.read_bytes()
+    bench(lambda: (base64.b64encode(screenshot), hashlib.sha256(screenshot).hexdigest()))
+
+
+def test_screenshot_capture(bench, page: Page):
+    """page.screenshot() of a local page, so no network time is included."""
+    page.set_viewport_size({"width": 1280, "height": 720})
+    page.set_content("<h1 class='title'>Products</h1>" + "<div class='inventory_item'>Sauce Labs Backpack</div>" * 6)
+    bench(page.screenshot, warmup=2, repeat=10)
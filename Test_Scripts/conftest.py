@@ -1,6 +1,163 @@
 # conftest.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 import pytest
 
+from framework import benchmark, collection_cache, data_source
+from framework.locator_timeouts import LocatorTimeoutPlugin
+from framework.mock_bank import MockBank, MockSession
+from framework.web_perf import DEFAULT_BUDGETS, THROTTLE_PROFILES, WebPerfPlugin
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("framework", "SDET practice framework")
+    group.addoption("--allure-store", action="store", dest="allure_store", default=None,
+                    help="Write Allure results to a compact store in this directory instead of one file per item. "
+                         "Export with: python Test_Scripts/framework/allure_store.py export <store> <allure-results>")
+    group.addoption("--allure-store-history", action="store", dest="allure_store_history", type=int, default=20,
+                    help="Number of previous runs kept in the store for Allure trend graphs (default: 20).")
+    group.addoption("--data-shard", action="store", dest="data_shard", default=None, metavar="INDEX/COUNT",
+                    help="Only run the @data_source cases whose stable case-ID hash falls in this shard, e.g. 0/4.")
+    group.addoption("--no-collection-cache", action="store_false", dest="collection_cache", default=True,
+                    help="Always import every test module, even those an unchanged -k selection cannot match.")
+    group.addoption("--startup-profile", action="store_true", dest="startup_profile", default=False,
+                    help="Report collection time and the slowest imports made while collecting.")
+    group.addoption("--http-latency", action="store", dest="http_latency", default=None, metavar="PATH",
+                    help="Record per-endpoint latency histograms of all requests calls and write them to PATH (JSON).")
+    group.addoption("--bench-dir", action="store", dest="bench_dir", default="benchmark-results",
+                    help="Directory for benchmark result JSON files, one per run (default: benchmark-results).")
+    group.addoption("--bench-compare", action="store", dest="bench_compare", default=None, metavar="PATH",
+                    help="Benchmark results file to compare with (default: the latest one in --bench-dir).")
+    group.addoption("--locator-timeouts", action="store", dest="locator_timeouts", default="apply",
+                    choices=("apply", "record", "off"),
+                    help="Page-object locator timeouts calibrated from earlier runs: apply them (default), "
+                         "only record durations, or turn calibration off.")
+    group.addoption("--locator-timeout-factor", action="store", dest="locator_timeout_factor", type=float,
+                    default=3.0, help="Calibrated timeout = p95 of recorded durations x this factor (default: 3).")
+    group.addoption("--locator-timeout-floor", action="store", dest="locator_timeout_floor", type=float,
+                    default=300.0, metavar="MS",
+                    help="Lower bound of calibrated timeouts in milliseconds (default: 300); raise it on slow agents.")
+    group.addoption("--locator-timeout-report", action="store_true", dest="locator_timeout_report", default=False,
+                    help="Report the recorded durations and calibrated timeout of every page-object locator.")
+    group.addoption("--web-perf", action="store", dest="web_perf", default=None, metavar="PATH",
+                    help="Collect web performance metrics of page-object navigations and write them to PATH (JSON).")
+    group.addoption("--perf-budgets", action="store", dest="perf_budgets", default=str(DEFAULT_BUDGETS),
+                    metavar="PATH", help="Per-page performance budgets checked with --web-perf "
+                                         "(default: Test_Scripts/perf_budgets.json).")
+    group.addoption("--perf-budgets-warn", action="store_true", dest="perf_budgets_warn", default=False,
+                    help="Only report navigations over budget instead of failing their tests.")
+    group.addoption("--perf-throttle", action="store", dest="perf_throttle", default=None,
+                    choices=sorted(THROTTLE_PROFILES),
+                    help="Emulate this network/CPU profile over CDP while collecting --web-perf (Chromium only).")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", f"{data_source.MARKER}(path, id_field=None): parametrize from a data file")
+    if benchmark.selects_benchmarks(config.option.markexpr):
+        benchmark.get_plugin(config)  # Up front, so an xdist controller merges its workers' results
+    # Opt-in plugins are imported only when enabled: http_latency alone pulls in requests
+    if config.getoption("allure_store"):
+        from framework.allure_store import AllureStorePlugin
+
+        config.pluginmanager.register(AllureStorePlugin(config), "allure_store")
+    if config.getoption("http_latency"):
+        from framework.http_latency import HttpLatencyPlugin
+
+        config.pluginmanager.register(HttpLatencyPlugin(config), "http_latency")
+    if config.getoption("startup_profile"):
+        from framework.startup_profile import StartupProfilePlugin
+
+        config.pluginmanager.register(StartupProfilePlugin(), "startup_profile")
+    if config.getoption("locator_timeouts") != "off" and getattr(config, "cache", None) is not None:
+        config.pluginmanager.register(LocatorTimeoutPlugin(config), "locator_timeouts")
+    if config.getoption("web_perf"):
+        config.pluginmanager.register(WebPerfPlugin(config), "web_perf")
+    if config.getoption("collection_cache") and getattr(config, "cache", None) is not None:
+        unsupported = collection_cache.unsupported_reason()
+        if unsupported:
+            config.issue_config_time_warning(pytest.PytestWarning(f"collection cache disabled: {unsupported}"),
+                                             stacklevel=2)
+        else:
+            config.pluginmanager.register(collection_cache.CollectionCachePlugin(config), "collection_cache")
+
+
+def pytest_generate_tests(metafunc):
+    data_source.generate_tests(metafunc)
+
+
+@pytest.fixture
+def data_case(request):
+    """The record of the current @data_source case, read from the data file only now."""
+    return request.param.load()
+
+
+@pytest.fixture(scope="session")
+def mock_bank_index():
+    """All mocks in Test_Scripts/mocks/, loaded and indexed once per session."""
+    return MockBank.load(Path(__file__).parent / "mocks")
+
+
+@pytest.fixture
+def mock_bank(context, mock_bank_index):
+    """
+    Serves the mock bank to every page of the test's browser context through one route.
+    Use mock_bank.override(...) for test-specific responses and mock_bank.assert_called(...).
+    """
+    session = MockSession(mock_bank_index)
+    session.install(context)
+    return session
+
+
+@pytest.fixture
+def run_async():
+    """
+    'run_async(coroutine)' runs it to completion in a new event loop on its own thread and
+    returns its result. Once a sync Playwright fixture has started, its event loop stays set
+    as running on the main thread for the rest of the session, so coroutines can't be run
+    there - whatever the test order or xdist --dist mode.
+    """
+    def run(coroutine):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    return run
+
+
+@pytest.fixture
+def new_async_pages(browser_name, browser_type_launch_args):
+    """
+    Async page factory for run_async: 'async with new_async_pages(3) as pages' opens 3 pages
+    in one browser, each in its own context (separate cookies/storage), so a single test can
+    drive them concurrently with asyncio.gather using the async page objects (pages/async_*.py).
+    """
+    @asynccontextmanager
+    async def new_pages(count):
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, browser_name).launch(**browser_type_launch_args)
+            try:
+                contexts = await asyncio.gather(*(browser.new_context() for _ in range(count)))
+                yield list(await asyncio.gather(*(context.new_page() for context in contexts)))
+            finally:
+                await browser.close()
+
+    return new_pages
+
+
+@pytest.fixture
+def framework_pytester(pytester, monkeypatch):
+    """
+    pytester whose test directory gets this conftest, so its runs load the framework
+    plugins and options just like a run of this suite.
+    """
+    monkeypatch.setenv("PYTHONPATH", str(Path(__file__).parent))  # For runpytest_subprocess
+    pytester.makeconftest(Path(__file__).read_text(encoding="utf8"))
+    return pytester
+
 
 @pytest.fixture
 def setup_data():
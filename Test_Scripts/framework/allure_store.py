@@ -0,0 +1,351 @@
+# framework/allure_store.py
+"""
+Compact, incremental store for Allure results.
+
+Instead of one JSON file per test/container/attachment in allure-results/, each
+pytest process (xdist worker or the main process) appends its records to its own
+worker-<id>.jsonl log, and attachments are written once per content hash into
+blobs/. At the end of the session the worker logs are merged into a single
+results.jsonl.gz plus a small index.json, and a rolling history of run summaries
+is kept for trend graphs.
+
+The standard allure-results layout is only produced on demand:
+    python Test_Scripts/framework/allure_store.py export allure-store allure-results
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+
+from allure_commons import hookimpl
+
+WORKER_LOG_PATTERN = "worker-*.jsonl"
+RESULTS_FILE = "results.jsonl.gz"
+INDEX_FILE = "index.json"
+HISTORY_FILE = "history.jsonl"
+BLOBS_DIR = "blobs"
+STATUSES = ("failed", "broken", "skipped", "passed", "unknown")
+
+# Maps the allure-commons file_pattern of an item to the record type stored in the logs
+ITEM_TYPES = {
+    "{prefix}-result.json": "result",
+    "{prefix}-container.json": "container",
+    "{prefix}-globals.json": "globals",
+}
+EXPORT_PATTERNS = {record_type: pattern for pattern, record_type in ITEM_TYPES.items()}
+
+
+def _blob_path(store_dir: Path, sha: str) -> Path:
+    return store_dir / BLOBS_DIR / sha[:2] / sha
+
+
+def clean_run_files(store_dir):
+    """Removes the logs of the previous run. Blobs and history are kept."""
+    store_dir = Path(store_dir)
+    for path in store_dir.glob(WORKER_LOG_PATTERN):
+        path.unlink()
+    for name in (RESULTS_FILE, INDEX_FILE):
+        (store_dir / name).unlink(missing_ok=True)
+
+
+class CompactAllureStore:
+    """
+    An allure-commons logger (same hooks as AllureFileLogger) that appends every
+    reported item to a per-worker JSONL log and de-duplicates attachments by hash.
+    """
+
+    def __init__(self, store_dir, worker_id="main"):
+        self.store_dir = Path(store_dir).absolute()
+        (self.store_dir / BLOBS_DIR).mkdir(parents=True, exist_ok=True)
+        self._log = open(self.store_dir / f"worker-{worker_id}.jsonl", "a", encoding="utf8")
+
+    def close(self):
+        if not self._log.closed:
+            self._log.close()
+
+    def _append(self, record: dict):
+        self._log.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._log.flush()  # One small write per item; a crashed worker keeps what it reported
+
+    def _report_item(self, item):
+        from attr import asdict  # Installed with allure-python-commons
+
+        data = asdict(item, filter=lambda _, v: v or v is False)
+        self._append({"type": ITEM_TYPES[item.file_pattern], "data": data})
+
+    def _store_blob(self, sha: str, write):
+        destination = _blob_path(self.store_dir, sha)
+        if destination.exists():
+            return  # Identical attachment already stored (this run or a previous one)
+        destination.parent.mkdir(exist_ok=True)
+        tmp_destination = destination.with_name(f"{sha}.{uuid.uuid4().hex}.tmp")
+        write(tmp_destination)
+        os.replace(tmp_destination, destination)
+
+    @hookimpl
+    def report_result(self, result):
+        self._report_item(result)
+
+    @hookimpl
+    def report_container(self, container):
+        self._report_item(container)
+
+    @hookimpl
+    def report_globals(self, globals_item):
+        self._report_item(globals_item)
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        digest = hashlib.sha256()
+        with open(source, "rb") as attached_file:
+            for chunk in iter(lambda: attached_file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        sha = digest.hexdigest()
+        self._store_blob(sha, lambda destination: shutil.copyfile(source, destination))
+        self._append({"type": "attachment", "name": file_name, "sha": sha})
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        sha = hashlib.sha256(body).hexdigest()
+        self._store_blob(sha, lambda destination: destination.write_bytes(body))
+        self._append({"type": "attachment", "name": file_name, "sha": sha})
+
+
+def _run_summary(results: list) -> dict:
+    """Builds the per-run entry kept in history.jsonl (status counts and per-test outcome)."""
+    statistic = dict.fromkeys(STATUSES, 0)
+    tests = {}
+    for result in results:
+        status = result.get("status", "unknown")
+        statistic[status if status in statistic else "unknown"] += 1
+        if result.get("historyId"):
+            tests[result["historyId"]] = {
+                "uid": result.get("uuid"),
+                "status": status,
+                "start": result.get("start"),
+                "stop": result.get("stop"),
+            }
+    statistic["total"] = len(results)
+    return {"time": int(time.time() * 1000), "statistic": statistic, "tests": tests}
+
+
+def merge_store(store_dir, history_limit=20) -> dict:
+    """
+    Merges the per-worker logs into results.jsonl.gz and index.json, appends the run
+    to the rolling history and drops blobs no longer referenced. Returns the index.
+    """
+    store_dir = Path(store_dir)
+    worker_logs = sorted(store_dir.glob(WORKER_LOG_PATTERN))
+    attachments = {}
+    results = []
+    counts = dict.fromkeys(EXPORT_PATTERNS, 0)
+
+    with gzip.open(store_dir / f"{RESULTS_FILE}.tmp", "wt", encoding="utf8") as merged:
+        for worker_log in worker_logs:
+            with open(worker_log, encoding="utf8") as log:
+                for line in log:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record["type"] == "attachment":
+                        attachments[record["name"]] = record["sha"]
+                        continue
+                    counts[record["type"]] += 1
+                    if record["type"] == "result":
+                        results.append(record["data"])
+                    merged.write(line if line.endswith("\n") else line + "\n")
+    os.replace(store_dir / f"{RESULTS_FILE}.tmp", store_dir / RESULTS_FILE)
+
+    summary = _run_summary(results)
+    index = {
+        "created": summary["time"],
+        "workers": len(worker_logs),
+        "counts": counts,
+        "statistic": summary["statistic"],
+        "attachments": attachments,
+        "blobs": len(set(attachments.values())),
+    }
+    (store_dir / INDEX_FILE).write_text(json.dumps(index, indent=2), encoding="utf8")
+
+    history_path = store_dir / HISTORY_FILE
+    history = history_path.read_text(encoding="utf8").splitlines() if history_path.exists() else []
+    history.append(json.dumps(summary, separators=(",", ":")))
+    history_path.write_text("\n".join(history[-history_limit:]) + "\n", encoding="utf8")
+
+    referenced = set(attachments.values())
+    for blob in (store_dir / BLOBS_DIR).glob("*/*"):
+        if blob.name not in referenced:
+            blob.unlink()
+    for shard in (store_dir / BLOBS_DIR).iterdir():
+        if not any(shard.iterdir()):
+            shard.rmdir()
+
+    for worker_log in worker_logs:
+        worker_log.unlink()
+    return index
+
+
+def _rewrite_attachment_sources(node, sources: dict):
+    """Points every attachment (in results, steps, befores/afters) at its de-duplicated file."""
+    if isinstance(node, dict):
+        for attachment in node.get("attachments", ()):
+            attachment["source"] = sources.get(attachment.get("source"), attachment.get("source"))
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                _rewrite_attachment_sources(value, sources)
+    elif isinstance(node, list):
+        for value in node:
+            _rewrite_attachment_sources(value, sources)
+
+
+def _link_or_copy(source: Path, destination: Path):
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _write_history(history: list, results_dir: Path):
+    """Writes Allure's history/ files (trend + per-test history) from previous runs."""
+    history_dir = results_dir / "history"
+    history_dir.mkdir(exist_ok=True)
+    trend = [
+        {"buildOrder": build_order, "reportName": "Allure Report", "reportUrl": "", "data": run["statistic"]}
+        for build_order, run in enumerate(history, start=1)
+    ]
+    per_test = {}
+    for run in history:
+        for history_id, test in run["tests"].items():
+            entry = per_test.setdefault(
+                history_id, {"statistic": dict.fromkeys(STATUSES + ("total",), 0), "items": []})
+            status = test["status"] if test["status"] in STATUSES else "unknown"
+            entry["statistic"][status] += 1
+            entry["statistic"]["total"] += 1
+            start, stop = test.get("start"), test.get("stop")
+            entry["items"].append({
+                "uid": test.get("uid"),
+                "reportUrl": "",
+                "status": status,
+                "time": {"start": start, "stop": stop,
+                         "duration": stop - start if start is not None and stop is not None else None},
+            })
+    for entry in per_test.values():
+        entry["items"].reverse()  # Allure lists the most recent run first
+    (history_dir / "history-trend.json").write_text(json.dumps(trend[::-1]), encoding="utf8")
+    (history_dir / "history.json").write_text(json.dumps(per_test), encoding="utf8")
+
+
+def export_store(store_dir, results_dir) -> int:
+    """
+    Writes the last merged run out in the standard allure-results layout, so the
+    Allure CLI / Jenkins plugin can generate a report from it. Returns the file count.
+    """
+    store_dir, results_dir = Path(store_dir), Path(results_dir)
+    index = json.loads((store_dir / INDEX_FILE).read_text(encoding="utf8"))
+    if results_dir.is_dir():
+        shutil.rmtree(results_dir)
+    results_dir.mkdir(parents=True)
+
+    # One file per unique attachment, named after its hash; every source is rewritten to it
+    sources = {}
+    for name, sha in index["attachments"].items():
+        extension = Path(name).suffix
+        sources[name] = f"{sha}-attachment{extension}"
+    for name in set(sources.values()):
+        _link_or_copy(_blob_path(store_dir, name.split("-", 1)[0]), results_dir / name)
+    written = len(set(sources.values()))
+
+    with gzip.open(store_dir / RESULTS_FILE, "rt", encoding="utf8") as merged:
+        for line in merged:
+            record = json.loads(line)
+            data = record["data"]
+            _rewrite_attachment_sources(data, sources)
+            file_name = EXPORT_PATTERNS[record["type"]].format(prefix=data.get("uuid") or uuid.uuid4())
+            (results_dir / file_name).write_text(json.dumps(data, ensure_ascii=False), encoding="utf8")
+            written += 1
+
+    history_path = store_dir / HISTORY_FILE
+    if history_path.exists():
+        runs = [json.loads(line) for line in history_path.read_text(encoding="utf8").splitlines() if line]
+        _write_history(runs[:-1], results_dir)  # The exported run itself is added by Allure
+    return written
+
+
+class AllureStorePlugin:
+    """
+    pytest plugin that swaps allure-pytest's one-file-per-item logger for the compact
+    store. Every process logs its own items; the controller (or the only process when
+    running without xdist) cleans up at start and merges at the end.
+    """
+
+    def __init__(self, config):
+        import allure_commons
+
+        self.config = config
+        self.store_dir = Path(config.getoption("allure_store")).absolute()
+        self.history_limit = config.getoption("allure_store_history")
+        self.is_worker = hasattr(config, "workerinput")
+        self.store = None
+        if config.option.collectonly:  # Nothing runs, so there is nothing to store or merge
+            return
+
+        if not self.is_worker:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            clean_run_files(self.store_dir)
+
+        if not config.option.allure_report_dir:
+            # allure-pytest only registers its listener alongside --alluredir
+            from allure_pytest.listener import AllureListener
+            from allure_pytest.plugin import cleanup_factory
+
+            listener = AllureListener(config)
+            config.pluginmanager.register(listener, "allure_listener")
+            allure_commons.plugin_manager.register(listener)
+            config.add_cleanup(cleanup_factory(listener))
+
+        worker_id = config.workerinput["workerid"] if self.is_worker else "main"
+        self.store = CompactAllureStore(self.store_dir, worker_id)
+        allure_commons.plugin_manager.register(self.store)
+
+    def pytest_unconfigure(self, config):
+        import allure_commons
+
+        if self.store is None:
+            return
+        allure_commons.plugin_manager.unregister(self.store)
+        self.store.close()
+        if not self.is_worker:
+            index = merge_store(self.store_dir, self.history_limit)
+            config.get_terminal_writer().line(
+                f"allure store: {sum(index['counts'].values())} items, {index['blobs']} unique attachments "
+                f"-> {self.store_dir}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge or export a compact Allure results store.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    merge_parser = subparsers.add_parser("merge", help="merge leftover worker logs (e.g. after a crashed run)")
+    merge_parser.add_argument("store_dir")
+    merge_parser.add_argument("--history", type=int, default=20)
+    export_parser = subparsers.add_parser("export", help="write the standard allure-results layout")
+    export_parser.add_argument("store_dir")
+    export_parser.add_argument("results_dir")
+    args = parser.parse_args(argv)
+
+    if args.command == "merge":
+        index = merge_store(args.store_dir, args.history)
+        print(f"Merged {sum(index['counts'].values())} items from {index['workers']} worker log(s).")
+    else:
+        written = export_store(args.store_dir, args.results_dir)
+        print(f"Exported {written} files to {args.results_dir}.")
+
+
+if __name__ == "__main__":
+    main()
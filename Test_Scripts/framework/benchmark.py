@@ -0,0 +1,124 @@
+# framework/benchmark.py
+"""
+Micro-benchmark harness for the framework's own hot paths (Test_Scripts/benchmarks/).
+
+The 'bench' fixture warms a callable up, picks how many calls make one sample
+(so each sample lasts at least ~10 ms), takes several samples and reports per-call
+statistics. Results of a run are written to benchmark-results/<timestamp>.json and
+compared with the previous run's file (or --bench-compare PATH).
+
+    pytest -m bench Test_Scripts/benchmarks
+
+The names (marker 'bench', plugin 'framework_bench', --bench-* options) stay clear of
+pytest-benchmark's 'benchmark' ones. The plugin is only registered when -m selects
+benchmarks, or by the first benchmark that runs otherwise.
+"""
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+MARKER = "bench"
+PLUGIN_NAME = "framework_bench"
+
+
+def selects_benchmarks(markexpr: str) -> bool:
+    """Whether a -m expression selects benchmarks: 'bench' or 'bench and not slow', not 'not bench'."""
+    return re.search(rf"(?<!not )\b{MARKER}\b", markexpr) is not None
+
+
+def get_plugin(config) -> "BenchmarkPlugin":
+    """The session's benchmark plugin, registered on first use."""
+    plugin = config.pluginmanager.get_plugin(PLUGIN_NAME)
+    if plugin is None:
+        plugin = BenchmarkPlugin(config)
+        config.pluginmanager.register(plugin, PLUGIN_NAME)
+    return plugin
+
+
+def measure(func, warmup: int = 3, repeat: int = 15, min_sample_time: float = 0.01) -> dict:
+    """Times func() and returns per-call statistics in microseconds."""
+    for _ in range(warmup):
+        func()
+
+    # Calibrate: double the calls per sample until one sample takes at least min_sample_time
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_sample_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1_000_000)
+
+    samples.sort()
+    return {
+        "calls_per_sample": number,
+        "samples": len(samples),
+        "min_us": samples[0],
+        "median_us": statistics.median(samples),
+        "mean_us": statistics.fmean(samples),
+        "stdev_us": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "p95_us": samples[min(len(samples) - 1, int(0.95 * len(samples)))],
+        "max_us": samples[-1],
+        "ops_per_second": 1_000_000 / statistics.median(samples),
+    }
+
+
+class BenchmarkPlugin:
+
+    def __init__(self, config):
+        self.config = config
+        self.results = {}
+        self.output_dir = Path(config.getoption("bench_dir"))
+        self.compare_path = config.getoption("bench_compare")
+        self.is_worker = hasattr(config, "workerinput")
+        self.baseline = None
+
+    def record(self, name: str, result: dict):
+        self.results[name] = result
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.results.update(getattr(node, "workeroutput", {}).get("benchmarks", {}))
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput["benchmarks"] = self.results
+            return
+        if not self.results:
+            return
+        previous = sorted(self.output_dir.glob("*.json"))
+        baseline_path = Path(self.compare_path) if self.compare_path else (previous[-1] if previous else None)
+        if baseline_path is not None and baseline_path.exists():
+            self.baseline = (baseline_path, json.loads(baseline_path.read_text(encoding="utf8"))["benchmarks"])
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_path = self.output_dir / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+        report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "benchmarks": dict(sorted(self.results.items()))}
+        self.output_path.write_text(json.dumps(report, indent=2), encoding="utf8")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.results:
+            return
+        terminalreporter.write_sep("-", f"benchmarks (per call) -> {self.output_path}")
+        baseline_path, baseline = self.baseline if self.baseline else (None, {})
+        if baseline_path is not None:
+            terminalreporter.write_line(f"compared with {baseline_path}")
+        terminalreporter.write_line(f"{'median us':>11} {'stdev us':>10} {'p95 us':>10} {'vs base':>8}  benchmark")
+        for name, result in sorted(self.results.items()):
+            change = ""
+            if name in baseline:
+                change = f"{(result['median_us'] / baseline[name]['median_us'] - 1) * 100:+7.1f}%"
+            terminalreporter.write_line(
+                f"{result['median_us']:11.2f} {result['stdev_us']:10.2f} {result['p95_us']:10.2f} {change:>8}  {name}")
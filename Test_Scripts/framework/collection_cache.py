@@ -0,0 +1,123 @@
+# framework/collection_cache.py
+"""
+Skips importing test modules that cannot match the current -k expression.
+
+After a normal collection, the -k keywords of every collected test are cached per
+module in .pytest_cache, together with the size/mtime of the files that decide what
+the module collects (the module itself, the conftest.py files above it and any
+@data_source data files). On the next run with -k, an unchanged module whose cached
+tests all fail the expression is ignored without being imported, so e.g.
+'pytest -k test_add' does not pay for Playwright, requests or jsonschema imports in
+modules it would deselect anyway.
+
+-k matching uses pytest's private KeywordMatcher and Expression; when a pytest upgrade
+moves or changes them, unsupported_reason() says why and the cache stays disabled.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+try:
+    from _pytest.mark import KeywordMatcher
+    from _pytest.mark.expression import Expression
+except ImportError:
+    KeywordMatcher = Expression = None
+
+CACHE_KEY = "collection_cache/modules"
+# Options that change the names or number of collected tests (e.g. pytest-playwright's
+# browser parametrization); a change in any of them invalidates the whole cache.
+FINGERPRINT_OPTIONS = ("browser", "browser_channel", "device", "data_shard")
+
+
+def unsupported_reason():
+    """Why this pytest's -k internals cannot back the cache, or None when they can."""
+    if KeywordMatcher is None or Expression is None:
+        return "_pytest.mark.KeywordMatcher or _pytest.mark.expression.Expression cannot be imported"
+    missing = [name for name, present in (
+        ("KeywordMatcher.from_item", hasattr(KeywordMatcher, "from_item")),
+        ("KeywordMatcher._names", "_names" in getattr(KeywordMatcher, "__dataclass_fields__", {})),
+        ("Expression.compile", hasattr(Expression, "compile")),
+        ("Expression.evaluate", hasattr(Expression, "evaluate")),
+    ) if not present]
+    return f"pytest {pytest.__version__} has no {', '.join(missing)}" if missing else None
+
+
+def _stat(path: Path) -> list:
+    try:
+        stat = path.stat()
+    except OSError:
+        return [str(path), None, None]
+    return [str(path), stat.st_mtime_ns, stat.st_size]
+
+
+class CollectionCachePlugin:
+
+    def __init__(self, config):
+        self.config = config
+        self.keyword = config.option.keyword.strip()
+        # xdist workers only read the cache, so every worker collects the same tests
+        self.read_only = hasattr(config, "workerinput")
+        # A list of plain values, so it compares equal after the JSON round trip through config.cache
+        self.fingerprint = [pytest.__version__, list(sys.version_info[:2])] + [
+            str(getattr(config.option, name, None)) for name in FINGERPRINT_OPTIONS]
+        cached = config.cache.get(CACHE_KEY, {})
+        self.modules = cached.get("modules", {}) if cached.get("fingerprint") == self.fingerprint else {}
+        self.collected = {}
+        self.failed = set()
+        self.skipped_modules = 0
+
+    def _dependencies(self, module_path: Path, items) -> list:
+        paths = {module_path}
+        for directory in module_path.parents:
+            paths.add(directory / "conftest.py")
+            if directory == self.config.rootpath:
+                break
+        for item in items:
+            marker = item.get_closest_marker("data_source")
+            if marker is not None:
+                paths.add((module_path.parent / marker.args[0]).resolve())
+        return sorted(_stat(path) for path in paths)
+
+    def _is_unchanged(self, entry: dict) -> bool:
+        return all(_stat(Path(path)) == [path, mtime, size] for path, mtime, size in entry["deps"])
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_ignore_collect(self, collection_path, config):
+        if not self.keyword or collection_path.suffix != ".py":
+            return None
+        entry = self.modules.get(str(collection_path))
+        if entry is None or not self._is_unchanged(entry):
+            return None
+        expression = Expression.compile(self.keyword)
+        if any(expression.evaluate(KeywordMatcher(frozenset(names))) for names in entry["items"]):
+            return None
+        self.skipped_modules += 1
+        return True
+
+    def pytest_itemcollected(self, item):
+        module = item.getparent(pytest.Module)
+        if module is not None:
+            self.collected.setdefault(module.path, []).append(item)
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.failed.add(str(report.fspath))
+
+    def pytest_collection_finish(self, session):
+        if self.read_only:
+            return
+        for module_path, items in self.collected.items():
+            if str(module_path) in self.failed:
+                self.modules.pop(str(module_path), None)
+                continue
+            self.modules[str(module_path)] = {
+                "deps": self._dependencies(module_path, items),
+                "items": [sorted(KeywordMatcher.from_item(item)._names) for item in items],
+            }
+        self.config.cache.set(CACHE_KEY, {"fingerprint": self.fingerprint, "modules": self.modules})
+
+    def pytest_report_collectionfinish(self, config):
+        if self.skipped_modules:
+            return f"collection cache: skipped importing {self.skipped_modules} module(s) not matching -k"
+        return None
@@ -0,0 +1,147 @@
+# framework/data_source.py
+"""
+Lazy parametrization from JSONL/CSV data files.
+
+    @data_source("data/get_single_post.jsonl", id_field="post_id")
+    def test_something(data_case):
+        data_case["post_id"] ...
+
+At collection time only the case IDs and the byte offset of each record are read
+(and cached in .pytest_cache keyed by file size/mtime), so a file with 100k cases
+does not have to be held in memory. Each case's record is parsed at run time by the
+'data_case' fixture. One record per line: JSONL objects, or CSV rows under a header.
+"""
+import csv
+import json
+import zlib
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import pytest
+
+MARKER = "data_source"
+CACHE_PREFIX = "data_source/"
+
+
+class CaseRef(NamedTuple):
+    """A pointer to one record in a data file; this is all that is kept per case until it runs."""
+    path: str
+    offset: int
+    case_id: str
+
+    def load(self) -> dict:
+        """Reads and parses the record this reference points at."""
+        with open(self.path, "rb") as data_file:
+            if self.path.endswith(".csv"):
+                header = _csv_row(data_file.readline())
+                data_file.seek(self.offset)
+                return dict(zip(header, _csv_row(data_file.readline())))
+            data_file.seek(self.offset)
+            return json.loads(data_file.readline())
+
+
+def data_source(path: str, id_field: Optional[str] = None):
+    """
+    Parametrizes the test's 'data_case' argument with one case per record of 'path'
+    (relative to the test module). Cases are named after 'id_field', or the line number.
+    """
+    return getattr(pytest.mark, MARKER)(path, id_field=id_field)
+
+
+def _csv_row(line: bytes) -> list:
+    return next(csv.reader([line.decode("utf-8").rstrip("\r\n")]))
+
+
+def index_cases(path: Path, id_field: Optional[str] = None) -> list:
+    """Returns [(case_id, offset), ...] for every non-empty record in a JSONL or CSV file."""
+    index = []
+    with open(path, "rb") as data_file:
+        id_column = None
+        if path.suffix == ".csv":
+            header = _csv_row(data_file.readline())
+            id_column = header.index(id_field) if id_field else None
+        line_number = 1 if path.suffix == ".csv" else 0  # The CSV header is line 1
+        while True:
+            offset = data_file.tell()
+            line = data_file.readline()
+            if not line:
+                break
+            line_number += 1
+            if not line.strip():
+                continue
+            if id_field is None:
+                case_id = f"line{line_number}"
+            elif id_column is not None:
+                case_id = _csv_row(line)[id_column]
+            else:
+                case_id = str(json.loads(line)[id_field])
+            index.append((case_id, offset))
+    return index
+
+
+def iter_cases(path, id_field: Optional[str] = None):
+    """Yields (case_id, record) for every record; for callers that need all cases at once."""
+    path = Path(path)
+    for case_id, offset in index_cases(path, id_field):
+        yield case_id, CaseRef(str(path), offset, case_id).load()
+
+
+def shard_of(case_id: str, shard_count: int) -> int:
+    """A stable (process and machine independent) shard number for a case ID."""
+    return zlib.crc32(case_id.encode("utf-8")) % shard_count
+
+
+def _cached_index(config, path: Path, id_field: Optional[str]) -> list:
+    stat = path.stat()
+    key = [stat.st_size, stat.st_mtime_ns, id_field]
+    cache = getattr(config, "cache", None)
+    cache_name = CACHE_PREFIX + path.as_posix().lstrip("/")
+    if cache is not None:
+        cached = cache.get(cache_name, None)
+        if cached and cached["key"] == key:
+            return cached["index"]
+    index = index_cases(path, id_field)
+    if cache is not None:
+        cache.set(cache_name, {"key": key, "index": index})
+    return index
+
+
+def parse_shard(value: str):
+    """Parses the --data-shard option ('INDEX/COUNT', zero based)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--data-shard expects INDEX/COUNT, got {value!r}")
+    if not 0 <= index < count:
+        raise pytest.UsageError(f"--data-shard index must be between 0 and {count - 1}, got {index}")
+    return index, count
+
+
+def generate_tests(metafunc):
+    """pytest_generate_tests implementation for tests marked with @data_source."""
+    marker = metafunc.definition.get_closest_marker(MARKER)
+    if marker is None:
+        return
+    if "data_case" not in metafunc.fixturenames:
+        raise pytest.UsageError(f"{metafunc.definition.nodeid}: @data_source tests must take a 'data_case' argument")
+
+    config = metafunc.config
+    path = (Path(metafunc.module.__file__).parent / marker.args[0]).resolve()
+    id_field = marker.kwargs.get("id_field")
+    shard = config.getoption("data_shard")
+    shard_index, shard_count = parse_shard(shard) if shard else (0, 1)
+
+    # With --dist loadgroup, cases in the same bucket stay on the same xdist worker between runs
+    group_count = None
+    if getattr(config.option, "dist", None) == "loadgroup" and hasattr(config, "workerinput"):
+        group_count = config.workerinput["workercount"]
+
+    params = []
+    for case_id, offset in _cached_index(config, path, id_field):
+        if shard_count > 1 and shard_of(case_id, shard_count) != shard_index:
+            continue
+        marks = ()
+        if group_count:
+            marks = pytest.mark.xdist_group(f"{path.stem}-{shard_of(case_id, group_count)}")
+        params.append(pytest.param(CaseRef(str(path), offset, case_id), id=case_id, marks=marks))
+    metafunc.parametrize("data_case", params, indirect=True)
@@ -0,0 +1,213 @@
+# framework/http_latency.py
+"""
+Per-endpoint HTTP latency histograms for everything sent through requests.
+
+--http-latency=PATH swaps the HTTPAdapter that every requests.Session (including
+the one behind requests.get/post/...) mounts for a TimingAdapter, which records the
+time of each send() under "METHOD /path/template". Numeric and UUID-like path
+segments are templated, so /posts/1 and /posts/100 both count as /posts/{id} (the
+same grouping locust's name= gives us in locustfile.py).
+
+Latencies go into HDR-style log-linear histograms: sparse, with <1% relative error,
+and mergeable by adding bucket counts. xdist workers send theirs to the controller,
+which writes the merged JSON, attaches it to the Allure report and prints a summary.
+"""
+import json
+import math
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+# Values keep their top 8 bits, so each power of two above 256 spans 128 linear sub-buckets (<0.8% error)
+SUB_BUCKET_BITS = 8
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+# (pattern, placeholder) applied to each path segment, in order
+TEMPLATE_RULES = (
+    (re.compile(r"^\d+$"), "{id}"),
+    (re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"), "{uuid}"),
+    (re.compile(r"^[0-9a-fA-F]{16,}$"), "{hash}"),
+)
+
+
+class LatencyHistogram:
+    """
+    Counts values (microseconds) in buckets that are exact below 256 and then split
+    every power of two into 128 linear sub-buckets, like HdrHistogram.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket_index(value: int) -> int:
+        shift = max(0, value.bit_length() - SUB_BUCKET_BITS)
+        return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+    @staticmethod
+    def highest_equivalent_value(index: int) -> int:
+        shift, sub_bucket = divmod(index, SUB_BUCKET_COUNT)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value: int):
+        value = max(0, int(value))
+        index = self.bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for bound, pick in (("min", min), ("max", max)):
+            values = [value for value in (getattr(self, bound), getattr(other, bound)) if value is not None]
+            setattr(self, bound, pick(values) if values else None)
+
+    def percentile(self, percentile: float):
+        """The value at or below which 'percentile' % of the recorded values fall."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.highest_equivalent_value(index), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "total": self.total, "min": self.min, "max": self.max,
+                "buckets": {str(index): count for index, count in sorted(self.buckets.items())}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.buckets = {int(index): count for index, count in data["buckets"].items()}
+        histogram.count, histogram.total = data["count"], data["total"]
+        histogram.min, histogram.max = data["min"], data["max"]
+        return histogram
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+    """Collapses IDs in a URL path, e.g. /posts/100/comments -> /posts/{id}/comments."""
+    segments = []
+    for segment in path.split("/"):
+        for pattern, placeholder in TEMPLATE_RULES:
+            if pattern.match(segment):
+                segment = placeholder
+                break
+        segments.append(segment)
+    return "/".join(segments) or "/"
+
+
+class LatencyRecorder:
+    """A histogram per 'METHOD /path/template', safe to record into from several threads."""
+
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, url: str, seconds: float):
+        endpoint = f"{method} {endpoint_template(urlsplit(url).path)}"
+        with self._lock:
+            histogram = self.histograms.get(endpoint)
+            if histogram is None:
+                histogram = self.histograms[endpoint] = LatencyHistogram()
+            histogram.record(seconds * 1_000_000)
+
+    def merge(self, data: dict):
+        with self._lock:
+            for endpoint, histogram_data in data.items():
+                histogram = LatencyHistogram.from_dict(histogram_data)
+                if endpoint in self.histograms:
+                    self.histograms[endpoint].merge(histogram)
+                else:
+                    self.histograms[endpoint] = histogram
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {endpoint: histogram.to_dict() for endpoint, histogram in sorted(self.histograms.items())}
+
+    def summary(self) -> dict:
+        """Percentiles per endpoint in milliseconds, for reports."""
+        summary = {}
+        for endpoint, histogram in sorted(self.histograms.items()):
+            summary[endpoint] = {"count": histogram.count, "mean_ms": histogram.total / histogram.count / 1000}
+            for percentile in (50, 90, 99):
+                summary[endpoint][f"p{percentile}_ms"] = histogram.percentile(percentile) / 1000
+            summary[endpoint]["max_ms"] = histogram.max / 1000
+        return summary
+
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter that records how long each send() took (until the response headers arrived)."""
+
+    recorder = None
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        if self.recorder is not None:
+            self.recorder.record(request.method, request.url, time.perf_counter() - start)
+        return response
+
+
+class HttpLatencyPlugin:
+
+    def __init__(self, config):
+        self.config = config
+        self.output = Path(config.getoption("http_latency"))
+        self.is_worker = hasattr(config, "workerinput")
+        self.recorder = TimingAdapter.recorder = LatencyRecorder()
+        # Session.__init__ looks HTTPAdapter up in requests.sessions, so new sessions mount ours
+        self._original_adapter = requests.sessions.HTTPAdapter
+        requests.sessions.HTTPAdapter = TimingAdapter
+
+    def pytest_unconfigure(self, config):
+        requests.sessions.HTTPAdapter = self._original_adapter
+        TimingAdapter.recorder = None
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        # Controller side of xdist: fold in each worker's histograms
+        self.recorder.merge(getattr(node, "workeroutput", {}).get("http_latency", {}))
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput["http_latency"] = self.recorder.to_dict()
+            return
+        report = {"unit": "us", "sub_bucket_bits": SUB_BUCKET_BITS,
+                  "summary": self.recorder.summary(), "histograms": self.recorder.to_dict()}
+        body = json.dumps(report, indent=2)
+        self.output.write_text(body, encoding="utf8")
+        try:
+            import allure
+        except ImportError:
+            return
+        allure.global_attach(body, name="HTTP latency per endpoint", attachment_type=allure.attachment_type.JSON)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.recorder.histograms:
+            return
+        terminalreporter.write_sep("-", f"HTTP latency per endpoint (ms) -> {self.output}")
+        terminalreporter.write_line(f"{'count':>7} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  endpoint")
+        for endpoint, stats in self.recorder.summary().items():
+            terminalreporter.write_line(
+                f"{stats['count']:7d} {stats['p50_ms']:8.1f} {stats['p90_ms']:8.1f} {stats['p99_ms']:8.1f} "
+                f"{stats['max_ms']:8.1f}  {endpoint}")
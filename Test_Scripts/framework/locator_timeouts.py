@@ -0,0 +1,162 @@
+# framework/locator_timeouts.py
+"""
+Adaptive per-locator timeouts, calibrated from how long page-object waits really take.
+
+Page objects wrap their assertions and actions in BasePage.timed(), which yields the
+timeout to pass to Playwright and times the block under a key such as
+"LoginPage.login_button:click":
+
+    with self.timed("login_button:click") as timeout:
+        self.login_button.click(timeout=timeout)
+
+The last WINDOW successful durations per key are kept in .pytest_cache between runs
+(only those measured on real Playwright pages: mocks and stubs in unit tests answer
+instantly and would drag the timeouts down). Once a key has MIN_SAMPLES of them its
+timeout becomes p95 x factor (clamped to [floor, ceiling], see the --locator-timeout-*
+options) instead of Playwright's 5 s / 30 s defaults - so a broken locator fails in a
+few hundred milliseconds, while a slow but healthy page gets more room than the
+default if it needs it.
+
+Reruns (pytest-rerunfailures) double the calibrated timeout per extra attempt.
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+CACHE_KEY = "locator_timeouts/samples"
+WINDOW = 50
+MIN_SAMPLES = 5
+PERCENTILE = 95
+
+_active = None
+
+
+def get_calibrator():
+    """The calibrator of the running session, or None when calibration is off."""
+    return _active
+
+
+def is_playwright_page(page) -> bool:
+    """True for a real sync or async Playwright Page, False for mocks and stubs."""
+    from playwright.async_api import Page as AsyncPage
+    from playwright.sync_api import Page
+
+    return isinstance(page, (Page, AsyncPage))
+
+
+@contextmanager
+def calibrated(key: str, page=None):
+    """
+    Yields the timeout (ms) for key - None, i.e. Playwright's default, while calibration
+    is off or the key has too few samples - and records how long the block took, if it
+    drove a real Playwright page.
+    """
+    calibrator = _active
+    if calibrator is None:
+        yield None
+        return
+    timeout = calibrator.timeout_for(key)
+    start = time.perf_counter()
+    yield timeout
+    # Only reached when the block succeeded: timeouts and failures are not samples
+    if is_playwright_page(page):
+        calibrator.record(key, (time.perf_counter() - start) * 1000)
+
+
+def percentile(samples: list, value: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(value / 100 * len(ordered)) - 1)]
+
+
+class TimeoutCalibrator:
+
+    def __init__(self, samples=None, apply=True, factor=3.0, floor_ms=300.0, ceiling_ms=30_000.0):
+        self.samples = {key: list(values)[-WINDOW:] for key, values in (samples or {}).items()}
+        self.new_samples = {}
+        self.apply = apply
+        self.factor = factor
+        self.floor_ms = floor_ms
+        self.ceiling_ms = ceiling_ms
+        self.attempt = 1
+        self._lock = threading.Lock()
+
+    def calibrated_timeout(self, key: str):
+        """p95 x factor for a key in milliseconds, or None while it has too few samples."""
+        samples = self.samples.get(key, ())
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return min(self.ceiling_ms, max(self.floor_ms, percentile(samples, PERCENTILE) * self.factor))
+
+    def timeout_for(self, key: str):
+        """The timeout (ms) to pass to Playwright for this key, or None for Playwright's default."""
+        if not self.apply:
+            return None
+        timeout = self.calibrated_timeout(key)
+        if timeout is None:
+            return None
+        return min(self.ceiling_ms, timeout * 2 ** (self.attempt - 1))
+
+    def record(self, key: str, elapsed_ms: float):
+        with self._lock:
+            self.new_samples.setdefault(key, []).append(round(elapsed_ms, 1))
+
+    def merge_new_samples(self, new_samples: dict):
+        with self._lock:
+            for key, values in new_samples.items():
+                self.new_samples.setdefault(key, []).extend(values)
+
+    def updated_samples(self) -> dict:
+        """The stored samples with this session's appended, trimmed to the rolling window."""
+        samples = {key: list(values) for key, values in self.samples.items()}
+        for key, values in self.new_samples.items():
+            samples[key] = (samples.get(key, []) + values)[-WINDOW:]
+        return samples
+
+
+class LocatorTimeoutPlugin:
+
+    def __init__(self, config):
+        global _active
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        self.calibrator = TimeoutCalibrator(
+            config.cache.get(CACHE_KEY, {}),
+            apply=config.getoption("locator_timeouts") == "apply",
+            factor=config.getoption("locator_timeout_factor"),
+            floor_ms=config.getoption("locator_timeout_floor"),
+        )
+        _active = self.calibrator
+
+    def pytest_unconfigure(self, config):
+        global _active
+        _active = None
+
+    def pytest_runtest_setup(self, item):
+        # pytest-rerunfailures counts attempts on the item; each rerun gets twice the room
+        self.calibrator.attempt = getattr(item, "execution_count", 1)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.calibrator.merge_new_samples(getattr(node, "workeroutput", {}).get("locator_timeouts", {}))
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput["locator_timeouts"] = self.calibrator.new_samples
+            return
+        self.samples = self.calibrator.updated_samples()
+        self.config.cache.set(CACHE_KEY, self.samples)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.config.getoption("locator_timeout_report") or not self.samples:
+            return
+        calibrated = TimeoutCalibrator(self.samples, factor=self.calibrator.factor, floor_ms=self.calibrator.floor_ms)
+        terminalreporter.write_sep("-", f"locator timeouts (p{PERCENTILE} x {calibrated.factor:g}, ms)")
+        terminalreporter.write_line(f"{'samples':>7} {'p50':>8} {'p95':>8} {'timeout':>8}  locator")
+        for key, samples in sorted(self.samples.items()):
+            timeout = calibrated.calibrated_timeout(key)
+            terminalreporter.write_line(
+                f"{len(samples):7d} {percentile(samples, 50):8.0f} {percentile(samples, PERCENTILE):8.0f} "
+                f"{'default' if timeout is None else f'{timeout:.0f}':>8}  {key}")
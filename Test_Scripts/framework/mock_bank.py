@@ -0,0 +1,186 @@
+# framework/mock_bank.py
+"""
+Declarative mock bank for Playwright network interception.
+
+Mocks are JSON files in Test_Scripts/mocks/, each a list of entries:
+
+    {"method": "GET", "url": "http://localhost:8000/api/posts/{id}",
+     "status": 200, "headers": {...}, "json": {"id": "${id}"}, "template": true, "latency_ms": 50}
+
+('body' may be used instead of 'json' for a raw string body.) The files are loaded
+once per session into an index: URLs without placeholders go into a hash map keyed
+by (method, url), templated ones into a per-host path trie. Bodies are encoded at
+load time; templated bodies only have their ${placeholders} filled in per request.
+Templates sharing a path prefix must name a placeholder at the same position alike
+(/posts/{id} and /posts/{id}/comments, not /posts/{post_id}/comments); loading fails otherwise.
+
+Per test, MockSession installs a single context-level route that looks every request
+up in the index (falling through to the network or other routes when nothing
+matches), supports per-test overrides and counts calls for assertions.
+"""
+import json
+import re
+from pathlib import Path
+from string import Template
+from urllib.parse import urlsplit
+
+PLACEHOLDER = re.compile(r"^\{(\w+)\}$")
+ANY_METHOD = "*"
+
+
+class MockResponse:
+    """A mocked response with its body already encoded (or compiled, for templated bodies)."""
+
+    __slots__ = ("status", "headers", "body", "template", "latency_ms", "url")
+
+    def __init__(self, entry: dict):
+        self.url = entry["url"]
+        self.status = entry.get("status", 200)
+        self.headers = dict(entry.get("headers", {}))
+        if "json" in entry:
+            text = json.dumps(entry["json"])
+            self.headers.setdefault("content-type", "application/json")
+        else:
+            text = entry.get("body", "")
+        self.template = Template(text) if entry.get("template") else None
+        self.body = text.encode("utf-8")
+        self.latency_ms = entry.get("latency_ms", 0)
+
+    def render(self, params: dict) -> bytes:
+        if self.template is None:
+            return self.body
+        return self.template.safe_substitute(params).encode("utf-8")
+
+
+class _TrieNode:
+    __slots__ = ("children", "param_name", "param_child", "responses")
+
+    def __init__(self):
+        self.children = {}
+        self.param_name = None
+        self.param_child = None
+        self.responses = {}  # method -> MockResponse
+
+    def match(self, segments: list, position: int, method: str, params: dict):
+        if position == len(segments):
+            return self.responses.get(method) or self.responses.get(ANY_METHOD)
+        child = self.children.get(segments[position])
+        if child is not None:  # Literal segments win over placeholders
+            found = child.match(segments, position + 1, method, params)
+            if found is not None:
+                return found
+        if self.param_child is not None:
+            params[self.param_name] = segments[position]
+            found = self.param_child.match(segments, position + 1, method, params)
+            if found is not None:
+                return found
+            del params[self.param_name]
+        return None
+
+
+def _split(url: str):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}", parts.path.split("/")
+
+
+class MockBank:
+    """The precompiled index: exact (method, url) hash map plus a path trie per origin."""
+
+    def __init__(self, entries=()):
+        self.exact = {}
+        self.tries = {}
+        self.size = 0
+        for entry in entries:
+            self.add(entry)
+
+    @classmethod
+    def load(cls, directory) -> "MockBank":
+        entries = []
+        for mock_file in sorted(Path(directory).glob("*.json")):
+            entries.extend(json.loads(mock_file.read_text(encoding="utf-8")))
+        return cls(entries)
+
+    def add(self, entry: dict):
+        response = MockResponse(entry)
+        method = entry.get("method", ANY_METHOD).upper()
+        origin, segments = _split(entry["url"])
+        if not any(PLACEHOLDER.match(segment) for segment in segments):
+            self.exact[(method, entry["url"])] = response
+        else:
+            node = self.tries.setdefault(origin, _TrieNode())
+            for segment in segments:
+                placeholder = PLACEHOLDER.match(segment)
+                if placeholder:
+                    if node.param_child is None:
+                        node.param_name, node.param_child = placeholder.group(1), _TrieNode()
+                    elif node.param_name != placeholder.group(1):
+                        # One trie node holds one name; the other would be matched but never filled in
+                        raise ValueError(
+                            f"Mock {method} {entry['url']}: placeholder {{{placeholder.group(1)}}} is used where "
+                            f"another mock already uses {{{node.param_name}}}; use the same name at this position")
+                    node = node.param_child
+                else:
+                    node = node.children.setdefault(segment, _TrieNode())
+            node.responses[method] = response
+        self.size += 1
+
+    def match(self, method: str, url: str):
+        """Returns (MockResponse, path params) for a request, or (None, None)."""
+        method = method.upper()
+        url_without_query = url.split("?", 1)[0].split("#", 1)[0]
+        for candidate in (url, url_without_query):
+            response = self.exact.get((method, candidate)) or self.exact.get((ANY_METHOD, candidate))
+            if response is not None:
+                return response, {}
+        origin, segments = _split(url_without_query)
+        trie = self.tries.get(origin)
+        if trie is not None:
+            params = {}
+            response = trie.match(segments, 0, method, params)
+            if response is not None:
+                return response, params
+        return None, None
+
+
+class MockSession:
+    """
+    One test's view of the bank: a single route handler, per-test overrides and call counts.
+    """
+
+    def __init__(self, bank: MockBank):
+        self.bank = bank
+        self.overrides = MockBank()
+        self.calls = {}  # (method, mock url) -> count
+
+    def install(self, context):
+        """Routes every request of the browser context through the bank."""
+        context.route("**/*", self.handle)
+
+    def override(self, method: str, url: str, **response):
+        """Replaces (or adds) a mock for this test only, e.g. override("GET", url, status=500)."""
+        self.overrides.add({"method": method, "url": url, **response})
+
+    def handle(self, route):
+        request = route.request
+        response, params = self.overrides.match(request.method, request.url)
+        if response is None:
+            response, params = self.bank.match(request.method, request.url)
+        if response is None:
+            route.fallback()
+            return
+        key = (request.method.upper(), response.url)
+        self.calls[key] = self.calls.get(key, 0) + 1
+        if response.latency_ms:
+            request.frame.page.wait_for_timeout(response.latency_ms)
+        route.fulfill(status=response.status, headers=response.headers, body=response.render(params))
+
+    def call_count(self, method: str, url: str) -> int:
+        """Calls served for a mock, by its method and URL as written in the mock file."""
+        return self.calls.get((method.upper(), url), 0)
+
+    def assert_called(self, method: str, url: str, times: int = None):
+        count = self.call_count(method, url)
+        if times is None:
+            assert count > 0, f"Expected {method} {url} to be called, but it wasn't"
+        else:
+            assert count == times, f"Expected {method} {url} to be called {times} time(s), got {count}"
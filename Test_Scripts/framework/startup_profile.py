@@ -0,0 +1,90 @@
+# framework/startup_profile.py
+"""
+--startup-profile: reports how long collection took and which imports it spent time on.
+
+A meta path finder wraps the loader of every module imported after conftest.py is
+loaded (i.e. test modules, page objects and whatever they pull in) and times its
+execution. Self time excludes nested imports, like 'python -X importtime'. Modules
+imported before that point (pytest plugins) are only visible with -X importtime.
+"""
+import sys
+import time
+from importlib.abc import MetaPathFinder
+
+import pytest
+
+
+class _TimedLoader:
+    """Delegates to the real loader and records how long exec_module took."""
+
+    def __init__(self, loader, profile):
+        self._loader = loader
+        self._profile = profile
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Put the real loader back, so the imported module looks exactly as it would without profiling
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profile.enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profile.exit(module.__name__, time.perf_counter() - start)
+
+
+class StartupProfilePlugin(MetaPathFinder):
+
+    def __init__(self, top=15):
+        self.top = top
+        self.timings = {}  # module name -> (cumulative seconds, self seconds)
+        self._child_time = []
+        self.collection_start = self.collection_time = None
+        sys.meta_path.insert(0, self)
+
+    def enter(self):
+        self._child_time.append(0.0)
+
+    def exit(self, name, elapsed):
+        children = self._child_time.pop()
+        self.timings[name] = (elapsed, elapsed - children)
+        if self._child_time:
+            self._child_time[-1] += elapsed
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection(self, session):
+        self.collection_start = time.perf_counter()
+
+    def pytest_collection_finish(self, session):
+        self.collection_time = time.perf_counter() - self.collection_start
+        sys.meta_path.remove(self)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", "startup profile")
+        if self.collection_time is not None:
+            terminalreporter.write_line(f"collection: {self.collection_time * 1000:.1f} ms")
+        total_self = sum(self_time for _, self_time in self.timings.values())
+        terminalreporter.write_line(
+            f"imports during collection: {len(self.timings)} modules, {total_self * 1000:.1f} ms")
+        terminalreporter.write_line(f"{'self ms':>9} {'cumulative ms':>14}  module")
+        slowest = sorted(self.timings.items(), key=lambda timing: timing[1][1], reverse=True)[:self.top]
+        for name, (cumulative, self_time) in slowest:
+            terminalreporter.write_line(f"{self_time * 1000:9.1f} {cumulative * 1000:14.1f}  {name}")
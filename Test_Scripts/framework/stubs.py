@@ -0,0 +1,30 @@
+# framework/stubs.py
+"""
+Stand-ins for Playwright objects, shared by the unit tests and the benchmarks so page
+objects and the mock bank can run without a browser.
+"""
+
+
+class StubPage:
+    """Stands in for a Playwright Page; locators are returned as (method, args, kwargs) tuples."""
+
+    def locator(self, selector):
+        return ("locator", (selector,), {})
+
+    def get_by_role(self, role, name):
+        return ("get_by_role", (role,), {"name": name})
+
+
+class FakeRoute:
+    """Stands in for a Playwright Route: records whether it was fulfilled or passed on."""
+
+    def __init__(self, method, url):
+        self.request = type("Request", (), {"method": method, "url": url})()
+        self.fulfilled = None
+        self.fell_back = False
+
+    def fulfill(self, status, headers, body):
+        self.fulfilled = {"status": status, "headers": headers, "body": body}
+
+    def fallback(self):
+        self.fell_back = True
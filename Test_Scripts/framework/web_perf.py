@@ -0,0 +1,260 @@
+# framework/web_perf.py
+"""
+Web performance metrics of page-object navigations, checked against per-page budgets.
+
+With --web-perf PATH, BasePage.goto() and the page-transition methods (login_successfully,
+go_to_cart, ...) run inside BasePage.navigation(), which measures the navigation and
+keys it by the page-object class it reaches. Per navigation this records:
+
+    duration_ms            document loads: Navigation Timing duration (until loadEvent end);
+                           client-side transitions: from the triggering action (e.g. the login
+                           click, not the typing before it) until the next page is ready
+    ttfb_ms, dom_content_loaded_ms, load_ms, fp_ms, fcp_ms, lcp_ms    document loads only
+    cls                    sum of layout shifts without recent input during the navigation
+    requests, transfer_kb  resources fetched during the navigation (and the document itself)
+
+LCP and layout shifts come from PerformanceObservers installed with an init script
+(Chromium only; other browsers report them as null). Metrics go to the test's Allure
+result and user_properties, and to PATH for the whole run, together with a per-page
+summary.
+
+Budgets are read from --perf-budgets (default: Test_Scripts/perf_budgets.json):
+
+    {"*": {"cls": 0.1}, "LoginPage": {"load_ms": 4000, "requests": 30}, ...}
+
+"*" applies to every page. A navigation exceeding its budget fails the test (or is
+only reported, with --perf-budgets-warn). --perf-throttle PROFILE emulates a network
+and CPU profile over CDP so the numbers are comparable between machines (Chromium only).
+"""
+import json
+import statistics
+import weakref
+from pathlib import Path
+
+import pytest
+
+DEFAULT_BUDGETS = Path(__file__).parent.parent / "perf_budgets.json"
+METRICS = ("duration_ms", "ttfb_ms", "dom_content_loaded_ms", "load_ms", "fp_ms", "fcp_ms", "lcp_ms", "cls",
+           "requests", "transfer_kb")
+
+# Bandwidths in bytes/s. slow-4g is Lighthouse's default mobile profile, the 3G ones are DevTools' presets.
+THROTTLE_PROFILES = {
+    "slow-4g": {"latency": 150, "download": 1.6 * 1024 * 1024 / 8, "upload": 750 * 1024 / 8, "cpu": 4},
+    "fast-3g": {"latency": 562.5, "download": 1.44 * 1024 * 1024 / 8, "upload": 675 * 1024 / 8, "cpu": 4},
+    "slow-3g": {"latency": 2000, "download": 400 * 1024 / 8, "upload": 400 * 1024 / 8, "cpu": 6},
+}
+
+INIT_SCRIPT = """
+(() => {
+  const perf = window.__webPerf = {lcp: null, shifts: []};
+  performance.setResourceTimingBufferSize(1000);
+  try {
+    new PerformanceObserver(list => {
+      const entries = list.getEntries();
+      perf.lcp = entries[entries.length - 1].startTime;
+    }).observe({type: "largest-contentful-paint", buffered: true});
+    new PerformanceObserver(list => {
+      for (const entry of list.getEntries()) {
+        if (!entry.hadRecentInput) perf.shifts.push([entry.startTime, entry.value]);
+      }
+    }).observe({type: "layout-shift", buffered: true});
+  } catch (error) {
+    // Entry types this browser doesn't support are reported as null
+  }
+})();
+"""
+
+MARK_SCRIPT = "() => ({origin: performance.timeOrigin, mark: performance.now()})"
+
+# 'since' is MARK_SCRIPT's result from before the navigation: a new timeOrigin means a document load
+COLLECT_SCRIPT = """
+(since) => {
+  const document_load = performance.timeOrigin !== since.origin;
+  const start = document_load ? 0 : since.mark;
+  const nav = document_load ? performance.getEntriesByType("navigation")[0] : null;
+  const resources = performance.getEntriesByType("resource").filter(entry => entry.startTime >= start);
+  const paint = name => {
+    const entry = document_load && performance.getEntriesByName(name)[0];
+    return entry ? entry.startTime : null;
+  };
+  const perf = window.__webPerf;
+  return {
+    url: location.href,
+    navigation: document_load ? "document" : "client-side",
+    duration_ms: nav ? nav.duration : performance.now() - start,
+    ttfb_ms: nav ? nav.responseStart : null,
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+    load_ms: nav ? nav.loadEventEnd : null,
+    fp_ms: paint("first-paint"),
+    fcp_ms: paint("first-contentful-paint"),
+    lcp_ms: perf && document_load ? perf.lcp : null,
+    cls: perf ? perf.shifts.filter(([time]) => time >= start).reduce((sum, [, value]) => sum + value, 0) : null,
+    requests: resources.length + (nav ? 1 : 0),
+    transfer_kb: (resources.reduce((sum, entry) => sum + entry.transferSize, 0) + (nav ? nav.transferSize : 0)) / 1024,
+  };
+}
+"""
+
+_active = None
+
+
+def get_collector():
+    """The collector of the running session, or None when --web-perf is off."""
+    return _active
+
+
+def load_budgets(path) -> dict:
+    path = Path(path)
+    return json.loads(path.read_text(encoding="utf8")) if path.exists() else {}
+
+
+def throttle_commands(profile: str) -> list:
+    """The CDP (method, params) calls that apply a throttling profile to a page."""
+    settings = THROTTLE_PROFILES[profile]
+    return [
+        ("Network.enable", {}),
+        ("Network.emulateNetworkConditions", {"offline": False, "latency": settings["latency"],
+                                              "downloadThroughput": settings["download"],
+                                              "uploadThroughput": settings["upload"]}),
+        ("Emulation.setCPUThrottlingRate", {"rate": settings["cpu"]}),
+    ]
+
+
+class WebPerfCollector:
+
+    def __init__(self, budgets=None, throttle=None):
+        self.budgets = budgets or {}
+        self.throttle = throttle
+        self.results = {}  # test node ID -> [navigation metrics]
+        self.unthrottled_browsers = set()
+        self.current = None
+        self._prepared_pages = weakref.WeakSet()
+
+    def start(self, nodeid: str):
+        self.current = nodeid
+        self.results.pop(nodeid, None)  # A rerun starts over
+
+    def needs_setup(self, page) -> bool:
+        """True the first time a page is seen: it still needs the init script (and throttling)."""
+        if page in self._prepared_pages:
+            return False
+        self._prepared_pages.add(page)
+        return True
+
+    def throttle_commands_for(self, page) -> list:
+        if self.throttle is None:
+            return []
+        browser = page.context.browser
+        browser_name = browser.browser_type.name if browser is not None else "unknown"
+        if browser_name != "chromium":  # CDP sessions are only available in Chromium
+            self.unthrottled_browsers.add(browser_name)
+            return []
+        return throttle_commands(self.throttle)
+
+    def check(self, page_name: str, metrics: dict) -> list:
+        budget = {**self.budgets.get("*", {}), **self.budgets.get(page_name, {})}
+        return [f"{page_name} {metric} {metrics[metric]:.2f} exceeds budget {limit}"
+                for metric, limit in budget.items() if metrics.get(metric) is not None and metrics[metric] > limit]
+
+    def record(self, page_name: str, metrics: dict):
+        metrics = {"page": page_name, "throttle": self.throttle, **metrics}
+        metrics["violations"] = self.check(page_name, metrics)
+        self.results.setdefault(self.current, []).append(metrics)
+        try:
+            import allure
+        except ImportError:
+            return
+        allure.attach(json.dumps(metrics, indent=2), name=f"Web performance: {page_name}",
+                      attachment_type=allure.attachment_type.JSON)
+
+    def summary(self) -> dict:
+        """Median of every metric per page-object class."""
+        by_page = {}
+        for navigations in self.results.values():
+            for navigation in navigations:
+                by_page.setdefault(navigation["page"], []).append(navigation)
+        summary = {}
+        for page_name, navigations in sorted(by_page.items()):
+            summary[page_name] = {"navigations": len(navigations)}
+            for metric in METRICS:
+                values = [navigation[metric] for navigation in navigations if navigation.get(metric) is not None]
+                summary[page_name][metric] = statistics.median(values) if values else None
+        return summary
+
+
+class WebPerfPlugin:
+
+    def __init__(self, config):
+        global _active
+        self.config = config
+        self.output = Path(config.getoption("web_perf"))
+        self.is_worker = hasattr(config, "workerinput")
+        self.enforce_budgets = not config.getoption("perf_budgets_warn")
+        self.collector = WebPerfCollector(load_budgets(config.getoption("perf_budgets")),
+                                          config.getoption("perf_throttle"))
+        _active = self.collector
+
+    def pytest_unconfigure(self, config):
+        global _active
+        _active = None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self.collector.start(item.nodeid)
+
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        navigations = self.collector.results.get(item.nodeid)
+        if call.when != "call" or not navigations:
+            return
+        item.user_properties[:] = [prop for prop in item.user_properties if prop[0] != "web_perf"]
+        item.user_properties.append(("web_perf", navigations))
+        violations = [violation for navigation in navigations for violation in navigation["violations"]]
+        if violations and report.passed and self.enforce_budgets:
+            report.outcome = "failed"
+            report.longrepr = "Web performance budget exceeded:\n  " + "\n  ".join(violations)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        workeroutput = getattr(node, "workeroutput", {})
+        self.collector.results.update(workeroutput.get("web_perf", {}))
+        self.collector.unthrottled_browsers.update(workeroutput.get("web_perf_unthrottled", []))
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput["web_perf"] = self.collector.results
+            self.config.workeroutput["web_perf_unthrottled"] = sorted(self.collector.unthrottled_browsers)
+            return
+        report = {"throttle": self.collector.throttle,
+                  "unthrottled_browsers": sorted(self.collector.unthrottled_browsers),
+                  "budgets": self.collector.budgets, "summary": self.collector.summary(),
+                  "tests": self.collector.results}
+        body = json.dumps(report, indent=2)
+        self.output.write_text(body, encoding="utf8")
+        try:
+            import allure
+        except ImportError:
+            return
+        allure.global_attach(body, name="Web performance per page", attachment_type=allure.attachment_type.JSON)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.collector.results:
+            return
+        throttle = f", throttled: {self.collector.throttle}" if self.collector.throttle else ""
+        terminalreporter.write_sep("-", f"web performance per page (median{throttle}) -> {self.output}")
+        if self.collector.unthrottled_browsers:
+            unthrottled = ", ".join(sorted(self.collector.unthrottled_browsers))
+            terminalreporter.write_line(f"not throttled (no CDP): {unthrottled}")
+        terminalreporter.write_line(
+            f"{'count':>5} {'duration':>9} {'fcp':>7} {'lcp':>7} {'cls':>6} {'requests':>8} {'KB':>7}  page")
+        for page_name, stats in self.collector.summary().items():
+            cells = [f"{stats[metric]:{width}.{digits}f}" if stats[metric] is not None else f"{'-':>{width}}"
+                     for metric, width, digits in (("duration_ms", 9, 0), ("fcp_ms", 7, 0), ("lcp_ms", 7, 0),
+                                                   ("cls", 6, 3), ("requests", 8, 0), ("transfer_kb", 7, 1))]
+            terminalreporter.write_line(f"{stats['navigations']:5d} {' '.join(cells)}  {page_name}")
+        violations = [violation for navigations in self.collector.results.values()
+                      for navigation in navigations for violation in navigation["violations"]]
+        for violation in violations:
+            terminalreporter.write_line(f"over budget: {violation}")
@@ -1,13 +1,15 @@
 import requests
 import datetime
 
+API_BASE_URL = "https://jsonplaceholder.typicode.com"
 
-def fetch_post_title(post_id):
+
+def fetch_post_title(post_id, base_url=API_BASE_URL):
     """
-    Fetches a post from JSONPlaceholder using requests.get
-    and returns its title.
+    Fetches a post from JSONPlaceholder (or another API at base_url, e.g. a local stub)
+    using requests.get and returns its title.
     """
-    url = f"https://jsonplaceholder.typicode.com/posts/{post_id}"
+    url = f"{base_url}/posts/{post_id}"
     print(f"DEBUG: Making actual API call to {url}")  # For demonstration
     response = requests.get(url)
     response.raise_for_status()  # Raise an exception for bad status codes (e.g., 4xx or 5xx)
@@ -0,0 +1,68 @@
+# pages/async_base_page.py
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from framework import web_perf
+from framework.locator_timeouts import calibrated
+from pages.locators import BASE_PAGE, bind_locators
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+def expect(actual):
+    """Playwright's async expect, imported on first use rather than when the page modules are imported."""
+    from playwright.async_api import expect as playwright_expect
+
+    return playwright_expect(actual)
+
+
+class AsyncBasePage:
+    """
+    Async counterpart of BasePage, for driving several pages concurrently in one event loop.
+    Locators come from the same definitions in pages/locators.py as the sync page objects.
+    """
+    locators = BASE_PAGE
+
+    def __init__(self, page: "Page"):
+        self.page = page
+        # Creating a locator doesn't await anything, so this is the same as in BasePage
+        bind_locators(self, page, self.locators)
+
+    async def goto(self, url: str):
+        """Navigates to a specific URL."""
+        async with self.navigation():
+            await self.page.goto(url)
+            # Generic example - wait until network is idle before proceeding
+            await self.page.wait_for_load_state("networkidle")
+
+    @asynccontextmanager
+    async def navigation(self, page_class=None):
+        """Async counterpart of BasePage.navigation()."""
+        collector = web_perf.get_collector()
+        if collector is None:
+            yield
+            return
+        if collector.needs_setup(self.page):
+            await self.page.add_init_script(web_perf.INIT_SCRIPT)
+            commands = collector.throttle_commands_for(self.page)
+            if commands:
+                cdp = await self.page.context.new_cdp_session(self.page)
+                for method, params in commands:
+                    await cdp.send(method, params)
+        since = await self.page.evaluate(web_perf.MARK_SCRIPT)
+        yield
+        page_name = (page_class or type(self)).__name__.removeprefix("Async")
+        collector.record(page_name, await self.page.evaluate(web_perf.COLLECT_SCRIPT, since))
+
+    async def get_page_title(self) -> str:
+        """Returns the current page title."""
+        return await self.page.title()
+
+    def get_current_url(self) -> str:
+        """Returns the current URL."""
+        return self.page.url
+
+    def timed(self, key: str):
+        """Same as BasePage.timed(); wraps awaited calls just as well."""
+        return calibrated(f"{type(self).__name__.removeprefix('Async')}.{key}", self.page)
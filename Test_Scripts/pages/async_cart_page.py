@@ -0,0 +1,25 @@
+# pages/async_cart_page.py
+from typing import TYPE_CHECKING
+
+from pages.async_base_page import AsyncBasePage
+from pages.locators import CART_PAGE
+
+if TYPE_CHECKING:
+    from pages.async_checkout_page import AsyncCheckoutPage
+
+
+class AsyncCartPage(AsyncBasePage):
+    """
+    Async Page Object for the cart page (see CartPage).
+    """
+    locators = CART_PAGE
+
+    async def go_to_checkout(self) -> "AsyncCheckoutPage":
+        """Clicks the checkout button and returns the AsyncCheckoutPage object."""
+        from pages.async_checkout_page import AsyncCheckoutPage
+
+        async with self.navigation(AsyncCheckoutPage):
+            with self.timed("checkout:click") as timeout:
+                await self.checkout.click(timeout=timeout)
+            await self.page.wait_for_url("**/checkout-step-one.html")
+        return AsyncCheckoutPage(self.page)
@@ -0,0 +1,22 @@
+# pages/async_checkout_page.py
+from pages.async_base_page import AsyncBasePage
+from pages.locators import CHECKOUT_PAGE
+
+
+class AsyncCheckoutPage(AsyncBasePage):
+    """
+    Async Page Object for the checkout page (see CheckoutPage).
+    """
+    locators = CHECKOUT_PAGE
+
+    async def fill_user_info(self, first_name, last_name, postal_code):
+        with self.timed("first_name_input:fill") as timeout:
+            await self.first_name_input.fill(first_name, timeout=timeout)
+        with self.timed("last_name_input:fill") as timeout:
+            await self.last_name_input.fill(last_name, timeout=timeout)
+        with self.timed("postal_code_input:fill") as timeout:
+            await self.postal_code_input.fill(postal_code, timeout=timeout)
+
+    async def continue_to_checkout_two(self):
+        with self.timed("continue_button:click") as timeout:
+            await self.continue_button.click(timeout=timeout)
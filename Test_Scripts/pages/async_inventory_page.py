@@ -0,0 +1,41 @@
+# pages/async_inventory_page.py
+from typing import TYPE_CHECKING
+
+from pages.async_base_page import AsyncBasePage, expect
+from pages.locators import INVENTORY_PAGE
+
+if TYPE_CHECKING:
+    from pages.async_cart_page import AsyncCartPage
+
+
+class AsyncInventoryPage(AsyncBasePage):
+    """
+    Async Page Object for the inventory/products page (see InventoryPage).
+    """
+    locators = INVENTORY_PAGE
+
+    async def is_products_title_visible(self) -> bool:
+        """Checks if the 'Products' title is visible on the page."""
+        return await self.products_title.is_visible()
+
+    async def get_products_title_text(self) -> str:
+        """Returns the text content of the 'Products' title."""
+        with self.timed("products_title:to_be_visible") as timeout:
+            await expect(self.products_title).to_be_visible(timeout=timeout)
+        return await self.products_title.text_content()
+
+    async def add_item_to_cart(self, item_name: str):
+        """Adds a specific item to the cart by its name."""
+        item_card = self.inventory_list.locator(".inventory_item").filter(has_text=item_name)
+        await item_card.get_by_role("button", name="Add to cart").click()
+
+    async def go_to_cart(self) -> "AsyncCartPage":
+        """Clicks the shopping cart icon and returns the new AsyncCartPage object."""
+        from pages.async_cart_page import AsyncCartPage
+
+        async with self.navigation(AsyncCartPage):
+            with self.timed("shopping_cart_icon:click") as timeout:
+                await self.shopping_cart_icon.click(timeout=timeout)
+            with self.timed("page:to_have_url") as timeout:
+                await expect(self.page).to_have_url("https://www.saucedemo.com/cart.html", timeout=timeout)
+        return AsyncCartPage(self.page)
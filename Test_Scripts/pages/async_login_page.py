@@ -0,0 +1,71 @@
+# pages/async_login_page.py
+from typing import TYPE_CHECKING
+
+from pages.async_base_page import AsyncBasePage, expect
+from pages.locators import LOGIN_PAGE
+import config
+
+if TYPE_CHECKING:
+    from pages.async_inventory_page import AsyncInventoryPage
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """
+    Async Page Object for the login page (see LoginPage).
+    """
+    locators = LOGIN_PAGE
+
+    async def navigate(self):
+        """Navigates to the login page and waits for the login button."""
+        await self.goto(config.BASE_URL)
+        with self.timed("login_button:to_be_visible") as timeout:
+            await expect(self.login_button).to_be_visible(timeout=timeout)
+
+    async def login(self, username, password):
+        """Performs a login action with given credentials."""
+        await self.fill_credentials(username, password)
+        await self.submit()
+
+    async def fill_credentials(self, username, password):
+        """Types the credentials without submitting them."""
+        with self.timed("username_input:fill") as timeout:
+            await self.username_input.fill(username, timeout=timeout)
+        with self.timed("password_input:fill") as timeout:
+            await self.password_input.fill(password, timeout=timeout)
+
+    async def submit(self):
+        """Clicks the login button."""
+        with self.timed("login_button:click") as timeout:
+            await self.login_button.click(timeout=timeout)
+
+    async def login_successfully(self, username, password) -> "AsyncInventoryPage":
+        """Performs a login action and returns the AsyncInventoryPage object if successful."""
+        from pages.async_inventory_page import AsyncInventoryPage
+
+        await self.fill_credentials(username, password)
+        async with self.navigation(AsyncInventoryPage):
+            await self.submit()
+            with self.timed("page:to_have_url") as timeout:
+                await expect(self.page).to_have_url(config.BASE_URL + "inventory.html", timeout=timeout)
+        return AsyncInventoryPage(self.page)
+
+    async def get_error_message_text(self) -> str:
+        """Returns the text of the error message."""
+        with self.timed("error_message:to_be_visible") as timeout:
+            await expect(self.error_message).to_be_visible(timeout=timeout)
+        return await self.error_message.text_content()
+
+    async def is_error_message_visible(self) -> bool:
+        """Checks if the error message element is visible."""
+        return await self.error_message.is_visible()
+
+    async def login_and_expect_success(self, username, password):
+        from pages.async_inventory_page import AsyncInventoryPage
+
+        await self.fill_credentials(username, password)
+        async with self.navigation(AsyncInventoryPage):
+            await self.submit()
+            with self.timed("page:to_have_url") as timeout:
+                await expect(self.page).to_have_url(config.BASE_URL + "inventory.html", timeout=timeout)
+            with self.timed("page_title:to_have_text") as timeout:
+                await expect(self.page_title).to_have_text("Products", timeout=timeout)
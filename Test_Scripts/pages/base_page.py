@@ -1,4 +1,19 @@
-from playwright.sync_api import Page, expect
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from framework import web_perf
+from framework.locator_timeouts import calibrated
+from pages.locators import BASE_PAGE, bind_locators
+
+if TYPE_CHECKING:  # Playwright is only needed for type hints at import time
+    from playwright.sync_api import Page
+
+
+def expect(actual):
+    """Playwright's expect, imported on first use rather than when the page modules are imported."""
+    from playwright.sync_api import expect as playwright_expect
+
+    return playwright_expect(actual)
 
 
 class BasePage:
@@ -6,18 +21,42 @@ class BasePage:
        A base class for all Page Objects, providing common functionalities
        like navigation, waiting, and common locators (e.g., for headers/footers).
        """
+    # Locator definitions live in pages/locators.py and are shared with the async page objects
+    locators = BASE_PAGE
 
-    def __init__(self, page: Page):
+    def __init__(self, page: "Page"):
         self.page = page
-        # Example of a common locator if all pages had one:
-        # self.header_title = page.locator("h1.header")
-        self.page_title = page.locator(".title")  # Locator for success page title
+        # Every entry of the page's locators becomes an attribute, e.g. self.page_title
+        bind_locators(self, page, self.locators)
 
     def goto(self, url: str):
         """Navigates to a specific URL."""
-        self.page.goto(url)
-        # Generic example - wait until network is idle before proceeding
-        self.page.wait_for_load_state("networkidle")
+        with self.navigation():
+            self.page.goto(url)
+            # Generic example - wait until network is idle before proceeding
+            self.page.wait_for_load_state("networkidle")
+
+    @contextmanager
+    def navigation(self, page_class=None):
+        """
+        Measures the navigation made inside the block, keyed by the page object it reaches
+        (default: this one). Does nothing unless the run has --web-perf (see framework/web_perf.py).
+        """
+        collector = web_perf.get_collector()
+        if collector is None:
+            yield
+            return
+        if collector.needs_setup(self.page):
+            self.page.add_init_script(web_perf.INIT_SCRIPT)
+            commands = collector.throttle_commands_for(self.page)
+            if commands:
+                cdp = self.page.context.new_cdp_session(self.page)
+                for method, params in commands:
+                    cdp.send(method, params)
+        since = self.page.evaluate(web_perf.MARK_SCRIPT)
+        yield
+        page_name = (page_class or type(self)).__name__.removeprefix("Async")
+        collector.record(page_name, self.page.evaluate(web_perf.COLLECT_SCRIPT, since))
 
     def get_page_title(self) -> str:
         """Returns the current page title."""
@@ -26,3 +65,14 @@ class BasePage:
     def get_current_url(self) -> str:
         """Returns the current URL."""
         return self.page.url
+
+    def timed(self, key: str):
+        """
+        Context manager yielding the calibrated timeout for "<locator>:<call>" of this page
+        object and recording how long the block took (see framework/locator_timeouts.py):
+
+            with self.timed("login_button:click") as timeout:
+                self.login_button.click(timeout=timeout)
+        """
+        # Sync and async page objects share their samples, e.g. "LoginPage.login_button:click"
+        return calibrated(f"{type(self).__name__.removeprefix('Async')}.{key}", self.page)
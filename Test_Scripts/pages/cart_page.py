@@ -1,24 +1,30 @@
 # pages/cart_page.py
-from playwright.sync_api import Page, expect, Locator
-from pages.base_page import BasePage
-from pages.checkout_page import CheckoutPage
+from typing import TYPE_CHECKING
+
+from pages.base_page import BasePage, expect
+from pages.locators import CART_PAGE
+
+if TYPE_CHECKING:
+    from pages.checkout_page import CheckoutPage
 
 class CartPage(BasePage):
     """
     Page Object for the cart page.
     """
-    def __init__(self, page: Page):
-        super().__init__(page)
-        # Locators (using Playwright's recommended locators where possible)
-        self.continue_shopping = page.get_by_role("button", name="continue-shopping")
-        self.checkout = page.get_by_role("button", name="checkout")
+    locators = CART_PAGE  # continue_shopping, checkout
 
     def verify_item_in_cart(self, item_name: str):
-        expect(self.item_name).to_be_visible()
+        with self.timed("item_name:to_be_visible") as timeout:
+            expect(self.item_name).to_be_visible(timeout=timeout)
 
-    def go_to_checkout(self) -> CheckoutPage:
+    def go_to_checkout(self) -> "CheckoutPage":
         """Clicks the checkout buttons and returns the CheckoutPage object if successful.
         """
-        self.checkout.click()
+        from pages.checkout_page import CheckoutPage  # Imported on use to keep the page modules independent
+
+        with self.navigation(CheckoutPage):
+            with self.timed("checkout:click") as timeout:
+                self.checkout.click(timeout=timeout)
+            self.page.wait_for_url("**/checkout-step-one.html")
 
         return CheckoutPage(self.page)  # Return the new Page Object
@@ -1,25 +1,23 @@
 # pages/checkout_page.py
-from playwright.sync_api import Page, Locator
 from pages.base_page import BasePage
+from pages.locators import CHECKOUT_PAGE
+
 
 class CheckoutPage(BasePage):
     """
     Page Object for the checkout page.
     """
-    def __init__(self, page: Page):
-        super().__init__(page)
-        # Locators (using Playwright's recommended locators where possible)
-        self.first_name_input = page.locator("#first-name")
-        self.last_name_input = page.locator("#last-name")
-        self.postal_code_input = page.locator("#postal-code")
-        self.cancel_button = page.get_by_role("button", name="cancel")
-        self.continue_button = page.locator("[data-test=\"continue\"]")
+    locators = CHECKOUT_PAGE  # first_name_input, last_name_input, postal_code_input, cancel_button, continue_button
 
     def fill_user_info(self, first_name, last_name, postal_code):
-        self.first_name_input.fill(first_name)
-        self.last_name_input.fill(last_name)
-        self.postal_code_input.fill(postal_code)
+        with self.timed("first_name_input:fill") as timeout:
+            self.first_name_input.fill(first_name, timeout=timeout)
+        with self.timed("last_name_input:fill") as timeout:
+            self.last_name_input.fill(last_name, timeout=timeout)
+        with self.timed("postal_code_input:fill") as timeout:
+            self.postal_code_input.fill(postal_code, timeout=timeout)
 
     def continue_to_checkout_two(self):
-        self.continue_button.click()
+        with self.timed("continue_button:click") as timeout:
+            self.continue_button.click(timeout=timeout)
 
@@ -0,0 +1,70 @@
+# pages/locators.py
+"""
+Locator definitions shared by the sync page objects and their async counterparts.
+
+Each page declares its locators once here as {attribute name: LocatorSpec}. Creating
+a locator does not touch the browser in either Playwright API, so the same spec
+resolves against a sync or an async Page, and BasePage/AsyncBasePage turn every entry
+into an attribute of the same name (e.g. LoginPage(page).login_button).
+"""
+from typing import NamedTuple
+
+
+class LocatorSpec(NamedTuple):
+    method: str  # Page method that builds the locator, e.g. "locator" or "get_by_role"
+    args: tuple
+    kwargs: dict
+
+    def resolve(self, page):
+        return getattr(page, self.method)(*self.args, **self.kwargs)
+
+
+def css(selector: str) -> LocatorSpec:
+    return LocatorSpec("locator", (selector,), {})
+
+
+def role(aria_role: str, name: str) -> LocatorSpec:
+    return LocatorSpec("get_by_role", (aria_role,), {"name": name})
+
+
+def bind_locators(page_object, page, specs: dict):
+    """Sets one attribute per spec on the page object."""
+    for name, spec in specs.items():
+        setattr(page_object, name, spec.resolve(page))
+
+
+BASE_PAGE = {
+    "page_title": css(".title"),  # Locator for success page title
+}
+
+LOGIN_PAGE = {
+    **BASE_PAGE,
+    "username_input": css("#user-name"),
+    "password_input": css("[data-test=\"password\"]"),
+    "login_button": css("#login-button"),
+    "error_message": css("[data-test=\"error\"]"),
+}
+
+INVENTORY_PAGE = {
+    **BASE_PAGE,
+    "products_title": css(".title"),
+    "shopping_cart_icon": css("#shopping_cart_container"),
+    # TBU - Add other locators specific to the Inventory Page here, e.g. add_to_cart_button, product_item_names
+    "inventory_list": css("[data-test='inventory-container']"),  # Container for all products
+    "sort_dropdown": css("[data-test=\"product-sort-container\"]"),
+}
+
+CART_PAGE = {
+    **BASE_PAGE,
+    "continue_shopping": role("button", "continue-shopping"),
+    "checkout": role("button", "checkout"),
+}
+
+CHECKOUT_PAGE = {
+    **BASE_PAGE,
+    "first_name_input": css("#first-name"),
+    "last_name_input": css("#last-name"),
+    "postal_code_input": css("#postal-code"),
+    "cancel_button": role("button", "cancel"),
+    "continue_button": css("[data-test=\"continue\"]"),
+}
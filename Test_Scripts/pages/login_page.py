@@ -1,47 +1,61 @@
-from playwright.sync_api import Page, expect
-from pages.base_page import BasePage  # Import the new BasePage
-from pages.inventory_page import InventoryPage  # Import the new InventoryPage
+from typing import TYPE_CHECKING
+
+from pages.base_page import BasePage, expect  # Import the new BasePage
+from pages.locators import LOGIN_PAGE
 import config
 
+if TYPE_CHECKING:
+    from pages.inventory_page import InventoryPage
+
 
 class LoginPage(BasePage):  # Inherit from BasePage
-    def __init__(self, page: Page):
-        super().__init__(page)  # Call the constructor of the parent class
-        self.page = page
-        # Locators (using Playwright's recommended locators where possible)
-        self.username_input = page.locator("#user-name")
-        self.password_input = page.locator("[data-test=\"password\"]")
-        self.login_button = page.locator("#login-button")
-        self.error_message = page.locator("[data-test=\"error\"]")
-        # self.page_title = page.locator(".title")  # Locator for success page title
+    locators = LOGIN_PAGE  # username_input, password_input, login_button, error_message (+ page_title)
 
     def navigate(self):
         """Navigates to the login page using the BasePage's goto method."""
         self.goto(config.BASE_URL)  # Use the inherited goto method
         # Ensure the login button is visible before attempting interaction
-        expect(self.login_button).to_be_visible()
+        with self.timed("login_button:to_be_visible") as timeout:
+            expect(self.login_button).to_be_visible(timeout=timeout)
 
     def login(self, username, password):
         """Performs a login action with given credentials."""
-        self.username_input.fill(username)
-        self.password_input.fill(password)
-        self.login_button.click()
+        self.fill_credentials(username, password)
+        self.submit()
+
+    def fill_credentials(self, username, password):
+        """Types the credentials without submitting them."""
+        with self.timed("username_input:fill") as timeout:
+            self.username_input.fill(username, timeout=timeout)
+        with self.timed("password_input:fill") as timeout:
+            self.password_input.fill(password, timeout=timeout)
 
-    def login_successfully(self, username, password) -> InventoryPage:
+    def submit(self):
+        """Clicks the login button."""
+        with self.timed("login_button:click") as timeout:
+            self.login_button.click(timeout=timeout)
+
+    def login_successfully(self, username, password) -> "InventoryPage":
         """Performs a login action and returns the InventoryPage object if successful.
         """
-        self.login(username, password)
-        # Use Playwright's expect to wait for the URL change or element presence,
-        # ensuring the page loaded correctly before returning the new Page Object.
-        # expect(self.page).to_have_url("https://www.saucedemo.com/inventory.html")
-        expect(self.page).to_have_url(config.BASE_URL + "inventory.html")
+        from pages.inventory_page import InventoryPage  # Imported on use to keep the page modules independent
+
+        self.fill_credentials(username, password)
+        with self.navigation(InventoryPage):  # Measures the transition only, not the typing
+            self.submit()
+            # Use Playwright's expect to wait for the URL change or element presence,
+            # ensuring the page loaded correctly before returning the new Page Object.
+            # expect(self.page).to_have_url("https://www.saucedemo.com/inventory.html")
+            with self.timed("page:to_have_url") as timeout:
+                expect(self.page).to_have_url(config.BASE_URL + "inventory.html", timeout=timeout)
 
         return InventoryPage(self.page)  # Return the new Page Object
 
     def get_error_message_text(self) -> str:
         """Returns the text of the error message."""
         # Explicitly wait for the error message to be visible and stable before getting its text
-        expect(self.error_message).to_be_visible()
+        with self.timed("error_message:to_be_visible") as timeout:
+            expect(self.error_message).to_be_visible(timeout=timeout)
         return self.error_message.text_content()
 
     def is_error_message_visible(self) -> bool:
@@ -49,9 +63,15 @@ class LoginPage(BasePage):  # Inherit from BasePage
         return self.error_message.is_visible()
 
     def login_and_expect_success(self, username, password):
-        self.login(username, password)
-        # Assert that URL changes AND a specific element on the next page is visible
-        expect(self.page).to_have_url(config.BASE_URL + "inventory.html")
-        expect(self.page_title).to_have_text(
-            "Products")  # Explicitly wait for the title element to be correct
+        from pages.inventory_page import InventoryPage
+
+        self.fill_credentials(username, password)
+        with self.navigation(InventoryPage):
+            self.submit()
+            # Assert that URL changes AND a specific element on the next page is visible
+            with self.timed("page:to_have_url") as timeout:
+                expect(self.page).to_have_url(config.BASE_URL + "inventory.html", timeout=timeout)
+            with self.timed("page_title:to_have_text") as timeout:
+                expect(self.page_title).to_have_text(
+                    "Products", timeout=timeout)  # Explicitly wait for the title element to be correct
         # No return needed, just assertions for successful login flow
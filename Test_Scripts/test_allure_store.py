@@ -0,0 +1,93 @@
+# test_allure_store.py
+import json
+import sys
+
+from allure_commons import model2
+
+from framework.allure_store import CompactAllureStore, export_store, merge_store
+
+
+def _report_run(store_dir, worker_id, status, history_id="test-history-id"):
+    """Reports one test with a screenshot-like attachment, the way allure-pytest would."""
+    store = CompactAllureStore(store_dir, worker_id)
+    attachment_name = f"{worker_id}-attachment.png"
+    store.report_attached_data(b"identical screenshot bytes", attachment_name)
+    screenshot = model2.Attachment(name="screenshot", source=attachment_name, type="image/png")
+    result = model2.TestResult(uuid=f"{worker_id}-uuid", name="test_example", status=status, historyId=history_id,
+                               start=1000, stop=1250, attachments=[screenshot])
+    store.report_result(result)
+    store.report_container(model2.TestResultContainer(uuid=f"{worker_id}-container", children=[result.uuid]))
+    store.close()
+
+
+def test_identical_attachments_are_stored_once(tmp_path):
+    """
+    Two workers attaching the same bytes should produce a single blob after merging.
+    """
+    _report_run(tmp_path, "gw0", "passed")
+    _report_run(tmp_path, "gw1", "passed")
+
+    index = merge_store(tmp_path)
+
+    assert index["workers"] == 2
+    assert index["counts"] == {"result": 2, "container": 2, "globals": 0}
+    assert len(index["attachments"]) == 2
+    assert index["blobs"] == 1
+    assert not list(tmp_path.glob("worker-*.jsonl"))  # Worker logs are folded into the merged file
+
+
+def test_export_writes_standard_layout_with_history(tmp_path):
+    """
+    Exporting should write one file per result/container, one per unique attachment
+    and the trend history of the previous runs.
+    """
+    store_dir, results_dir = tmp_path / "store", tmp_path / "allure-results"
+    _report_run(store_dir, "main", "failed")
+    merge_store(store_dir)
+    _report_run(store_dir, "main", "passed")
+    merge_store(store_dir)
+
+    export_store(store_dir, results_dir)
+
+    result_files = list(results_dir.glob("*-result.json"))
+    assert len(result_files) == 1
+    assert len(list(results_dir.glob("*-container.json"))) == 1
+    result = json.loads(result_files[0].read_text())
+    assert result["status"] == "passed"
+    assert (results_dir / result["attachments"][0]["source"]).read_bytes() == b"identical screenshot bytes"
+
+    trend = json.loads((results_dir / "history" / "history-trend.json").read_text())
+    assert [run["data"]["failed"] for run in trend] == [1]  # Only the previous run; Allure adds the current one
+    history = json.loads((results_dir / "history" / "history.json").read_text())
+    assert history["test-history-id"]["items"][0]["time"]["duration"] == 250
+
+
+def test_collect_only_leaves_no_worker_log(framework_pytester):
+    framework_pytester.makepyfile(test_sample="def test_one():\n    pass\n")
+
+    result = framework_pytester.runpytest_subprocess("--collect-only", "--allure-store=store")
+
+    result.assert_outcomes()
+    assert not (framework_pytester.path / "store").exists()
+
+
+def test_listener_is_unregistered_after_each_session(framework_pytester):
+    """
+    Consecutive sessions in one process (pytest.main, pytester) must not pile up Allure listeners.
+    """
+    framework_pytester.makepyfile(test_sample="def test_one():\n    pass\n")
+    framework_pytester.makepyfile(run_twice="""
+        import allure_commons
+        import pytest
+        from allure_pytest.listener import AllureListener
+
+        for _ in range(2):
+            pytest.main(["--allure-store=store", "-p", "no:cacheprovider", "test_sample.py"])
+        print("listeners left:", sum(isinstance(plugin, AllureListener)
+                                     for plugin in allure_commons.plugin_manager.get_plugins()))
+    """)
+
+    result = framework_pytester.run(sys.executable, "run_twice.py")
+
+    result.stdout.fnmatch_lines(["listeners left: 0"])
+    assert (framework_pytester.path / "store" / "index.json").exists()
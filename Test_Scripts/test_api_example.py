@@ -3,7 +3,9 @@ import pytest
 import requests
 import os  # Import the os module to access environment variables
 import json
-from jsonschema import validate, ValidationError
+from functools import lru_cache
+from pathlib import Path
+from framework.data_source import data_source
 # Read BASE_URL from an environment variable, with a fallback for local execution
 BASE_URL = os.getenv("API_BASE_URL", "https://jsonplaceholder.typicode.com")  # A public API for mock data
 # If API_BASE_URL is not set, it will default to jsonplaceholder.typicode.com
@@ -38,16 +40,12 @@ def test_get_single_post():
 
 # A couple of data Driven API tests
 
-@pytest.mark.parametrize("post_id, expected_title_contains", [
-    (1, "sunt aut facere"),  # Valid post 1
-    (10, "optio molestias id quia eum"),  # Valid post 10
-    (100, "at nam consequatur"),  # Valid post 100
-    (999999, None)  # Non-existent post
-])
-def test_get_single_post_data_driven(post_id, expected_title_contains):
+@data_source("data/get_single_post.jsonl", id_field="post_id")  # Valid posts 1, 10, 100 and a non-existent post
+def test_get_single_post_data_driven(data_case):
     """
     Tests retrieving a single post by ID using parametrization.
     """
+    post_id, expected_title_contains = data_case["post_id"], data_case["expected_title_contains"]
     response = requests.get(f"{BASE_URL}/posts/{post_id}")
 
     if expected_title_contains is not None:
@@ -63,16 +61,14 @@ def test_get_single_post_data_driven(post_id, expected_title_contains):
         print(f"GET non-existent post ID {post_id} returned 404 as expected.")
 
 
-@pytest.mark.parametrize("test_case_name, payload, expected_status_code", [
-    ("Valid Post Creation", {"title": "Test Title 1", "body": "Test Body 1", "userId": 1}, 201),
-    ("Another Valid Post", {"title": "Another Title", "body": "Another Body", "userId": 2}, 201),
-    ("Post with Missing Body", {"title": "No Body Post", "userId": 3}, 201),  # JSONPlaceholder often still accepts this
-    ("Post with Extra Field", {"title": "Extra Field", "body": "Data", "extra_field": "value", "userId": 4}, 201)
-])
-def test_create_post_data_driven(test_case_name, payload, expected_status_code):
+# JSONPlaceholder often still accepts payloads with a missing body or extra fields
+@data_source("data/create_post.jsonl", id_field="test_case_name")
+def test_create_post_data_driven(data_case):
     """
     Tests creating posts with different payloads using parametrization.
     """
+    test_case_name, payload = data_case["test_case_name"], data_case["payload"]
+    expected_status_code = data_case["expected_status_code"]
     print(f"\n--- Running Test Case: {test_case_name} ---")
     response = requests.post(f"{BASE_URL}/posts", json=payload)
     assert response.status_code == expected_status_code
@@ -152,27 +148,29 @@ def test_get_non_existent_post():
 
 # JSON Schema related tests
 
-def load_json_schema(filename):
-    """Loads a JSON schema from the 'schemas' directory."""
-    filepath = f"Test_Scripts/schemas/{filename}"
-    with open(filepath, 'r') as file:
-        return json.load(file)
+SCHEMAS_DIR = Path(__file__).parent / "schemas"  # Independent of the directory pytest is started from
 
 
-POST_SCHEMA = load_json_schema("post_schema.json")
+@lru_cache(maxsize=None)
+def load_json_schema(filename):
+    """Loads a JSON schema from the 'schemas' directory (once, on first use rather than at import)."""
+    with open(SCHEMAS_DIR / filename, 'r') as file:
+        return json.load(file)
 
 
 def test_get_single_post_schema_validation():
     """
     Tests retrieving a single valid post and validates its schema.
     """
+    from jsonschema import validate, ValidationError  # Imported on use; only the schema tests need it
+
     post_id = 1
     response = requests.get(f"{BASE_URL}/posts/{post_id}")
     assert response.status_code == 200
     post_data = response.json()
 
     try:
-        validate(instance=post_data, schema=POST_SCHEMA)
+        validate(instance=post_data, schema=load_json_schema("post_schema.json"))
         print(f"\nResponse for post ID {post_id} successfully validated against schema.")
     except ValidationError as e:
         pytest.fail(f"Schema validation failed for post ID {post_id}:\n{e.message}\nPath: {e.path}\nValidator: {e.validator}\nValidator Value: {e.validator_value}")
@@ -185,6 +183,8 @@ def test_invalid_post_schema_validation_example():
     Demonstrates schema validation failure with an invalid response structure.
     This test is expected to fail.
     """
+    from jsonschema import validate, ValidationError
+
     invalid_data = {
         "userId": "1",  # Should be integer, not string
         "id": 1,
@@ -196,7 +196,7 @@ def test_invalid_post_schema_validation_example():
     # In the real world, this would be retrieved from an API call that returned bad data
 
     try:
-        validate(instance=invalid_data, schema=POST_SCHEMA)
+        validate(instance=invalid_data, schema=load_json_schema("post_schema.json"))
         pytest.fail("Schema validation unexpectedly passed for invalid data!")
     except ValidationError as e:
         print(f"\nSuccessfully caught expected schema validation error:\n{e.message}\nPath: {e.path}\nValidator: {e.validator}\nValidator Value: {e.validator_value}")
@@ -0,0 +1,27 @@
+# test_benchmark.py
+import pytest
+
+from framework.benchmark import selects_benchmarks
+
+
+@pytest.mark.parametrize("markexpr, expected", [
+    ("bench", True),
+    ("bench and not slow", True),
+    ("smoke or bench", True),
+    ("not bench", False),
+    ("", False),
+    ("benchmark", False),  # pytest-benchmark's marker is not ours
+])
+def test_selects_benchmarks(markexpr, expected):
+    assert selects_benchmarks(markexpr) is expected
+
+
+def test_plugin_is_only_registered_when_benchmarks_are_selected(framework_pytester):
+    framework_pytester.makepyfile(test_plugin="""
+def test_registered(request):
+    print("framework_bench registered:", request.config.pluginmanager.has_plugin("framework_bench"))
+""")
+
+    framework_pytester.runpytest_subprocess("-s").stdout.fnmatch_lines(["*framework_bench registered: False*"])
+    framework_pytester.runpytest_subprocess("-s", "-m", "bench or not bench").stdout.fnmatch_lines(
+        ["*framework_bench registered: True*"])
@@ -0,0 +1,80 @@
+# test_collection_cache.py
+import os
+
+import pytest
+
+from framework import collection_cache
+
+COUNTING_MODULE = """
+from pathlib import Path
+
+with open(Path(__file__).with_suffix(".imports"), "a") as imports:  # One line per import
+    imports.write("imported\\n")
+
+
+def test_other():
+    pass
+"""
+
+
+@pytest.fixture
+def project(framework_pytester):
+    framework_pytester.makepyfile(test_math="def test_add():\n    pass\n", test_other=COUNTING_MODULE)
+    framework_pytester.runpytest_subprocess("--collect-only").assert_outcomes()  # Fills the cache
+    return framework_pytester
+
+
+def imports_of_test_other(pytester) -> int:
+    return len((pytester.path / "test_other.imports").read_text().splitlines())
+
+
+def test_unchanged_module_that_cannot_match_is_not_imported(project):
+    result = project.runpytest_subprocess("--collect-only", "-k", "test_add")
+
+    result.stdout.fnmatch_lines(["collection cache: skipped importing 1 module(s) not matching -k",
+                                 "*<Function test_add>*"])
+    assert imports_of_test_other(project) == 1
+
+
+def test_modified_module_is_collected_again(project):
+    project.makepyfile(test_other=COUNTING_MODULE + "\n\ndef test_add_more():\n    pass\n")
+
+    result = project.runpytest_subprocess("--collect-only", "-k", "test_add")
+
+    result.stdout.fnmatch_lines(["*<Function test_add_more>*"])
+    result.stdout.no_fnmatch_line("collection cache: skipped*")
+    assert imports_of_test_other(project) == 2
+
+
+def test_conftest_change_invalidates_modules_below_it(project):
+    conftest = project.path / "conftest.py"
+    stat = conftest.stat()
+    os.utime(conftest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    result = project.runpytest_subprocess("--collect-only", "-k", "test_add")
+
+    result.stdout.no_fnmatch_line("collection cache: skipped*")
+    assert imports_of_test_other(project) == 2
+
+
+def test_no_collection_cache_imports_every_module(project):
+    result = project.runpytest_subprocess("--collect-only", "-k", "test_add", "--no-collection-cache")
+
+    result.stdout.no_fnmatch_line("collection cache: skipped*")
+    assert imports_of_test_other(project) == 2
+
+
+def test_pytest_keyword_internals_still_behave_as_the_cache_expects(request):
+    # The cache uses private pytest API: fail here, loudly, when an upgrade changes it
+    assert collection_cache.unsupported_reason() is None
+    names = collection_cache.KeywordMatcher.from_item(request.node)._names
+    assert {"test_pytest_keyword_internals_still_behave_as_the_cache_expects", "test_collection_cache.py"} <= names
+    matcher = collection_cache.KeywordMatcher(frozenset(names))
+    assert collection_cache.Expression.compile("internals and not test_add").evaluate(matcher)
+    assert not collection_cache.Expression.compile("test_add").evaluate(matcher)
+
+
+def test_missing_pytest_internals_disable_the_cache(monkeypatch):
+    monkeypatch.setattr(collection_cache, "KeywordMatcher", None)
+
+    assert "cannot be imported" in collection_cache.unsupported_reason()
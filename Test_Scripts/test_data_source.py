@@ -0,0 +1,49 @@
+# test_data_source.py
+import pytest
+
+from framework.data_source import CaseRef, index_cases, parse_shard, shard_of
+
+
+def test_jsonl_cases_are_indexed_by_id_and_loaded_lazily(tmp_path):
+    """
+    Indexing keeps only IDs and offsets; the record is parsed when the case is loaded.
+    """
+    data_file = tmp_path / "cases.jsonl"
+    data_file.write_text('{"name": "first", "value": 1}\n\n{"name": "second", "value": [2, 3]}\n')
+
+    index = index_cases(data_file, id_field="name")
+
+    assert [case_id for case_id, _ in index] == ["first", "second"]
+    case_id, offset = index[1]
+    assert CaseRef(str(data_file), offset, case_id).load() == {"name": "second", "value": [2, 3]}
+
+
+def test_csv_cases_default_to_line_number_ids(tmp_path):
+    """
+    CSV rows are loaded against the header; without an id_field cases are named by line.
+    """
+    data_file = tmp_path / "cases.csv"
+    data_file.write_text('username,password\nstandard_user,secret_sauce\n"user, quoted",pw\n')
+
+    index = index_cases(data_file)
+
+    assert [case_id for case_id, _ in index] == ["line2", "line3"]
+    case_id, offset = index[1]
+    assert CaseRef(str(data_file), offset, case_id).load() == {"username": "user, quoted", "password": "pw"}
+
+
+def test_shards_are_stable_and_cover_every_case():
+    """
+    Every case lands in exactly one shard, and always the same one.
+    """
+    case_ids = [f"case-{number}" for number in range(200)]
+    shards = [shard_of(case_id, 4) for case_id in case_ids]
+
+    assert shards == [shard_of(case_id, 4) for case_id in case_ids]
+    assert set(shards) == {0, 1, 2, 3}
+
+
+@pytest.mark.parametrize("value", ["4/4", "1", "a/b"])
+def test_invalid_shard_option_is_rejected(value):
+    with pytest.raises(pytest.UsageError):
+        parse_shard(value)
@@ -0,0 +1,52 @@
+# test_http_latency.py
+import random
+
+import pytest
+
+from framework.http_latency import LatencyHistogram, LatencyRecorder, endpoint_template
+
+
+@pytest.mark.parametrize("path, expected_template", [
+    ("/posts/1", "/posts/{id}"),
+    ("/posts/100/comments", "/posts/{id}/comments"),
+    ("/users/3f2504e0-4f89-11d3-9a0c-0305e82c3301", "/users/{uuid}"),
+    ("/posts", "/posts"),
+    ("", "/"),
+])
+def test_endpoint_template(path, expected_template):
+    assert endpoint_template(path) == expected_template
+
+
+def test_percentiles_are_within_one_percent():
+    """
+    Bucketed percentiles should stay within the histogram's relative error of the exact values.
+    """
+    rng = random.Random(42)
+    values = sorted(rng.randint(1, 5_000_000) for _ in range(10_000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for percentile in (50, 90, 99, 100):
+        exact = values[max(0, int(percentile / 100 * len(values)) - 1)]
+        assert histogram.percentile(percentile) == pytest.approx(exact, rel=0.01)
+    assert (histogram.min, histogram.max, histogram.count) == (values[0], values[-1], len(values))
+
+
+def test_recorders_merge_like_a_single_recorder():
+    """
+    Merging per-worker recorders (as the xdist controller does) matches recording everything in one.
+    """
+    combined, worker_a, worker_b = LatencyRecorder(), LatencyRecorder(), LatencyRecorder()
+    for post_id, seconds in enumerate([0.120, 0.045, 0.300, 0.051, 0.075], start=1):
+        url = f"https://jsonplaceholder.typicode.com/posts/{post_id}"
+        combined.record("GET", url, seconds)
+        (worker_a if post_id % 2 else worker_b).record("GET", url, seconds)
+
+    merged = LatencyRecorder()
+    merged.merge(worker_a.to_dict())
+    merged.merge(worker_b.to_dict())
+
+    assert merged.to_dict() == combined.to_dict()
+    assert list(merged.summary()) == ["GET /posts/{id}"]
+    assert merged.summary()["GET /posts/{id}"]["count"] == 5
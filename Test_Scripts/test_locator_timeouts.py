@@ -0,0 +1,93 @@
+# test_locator_timeouts.py
+import pytest
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page
+
+from framework import locator_timeouts
+from framework.locator_timeouts import MIN_SAMPLES, WINDOW, TimeoutCalibrator
+from pages.async_login_page import AsyncLoginPage
+from pages.login_page import LoginPage
+
+
+def test_timeouts_are_p95_times_factor_clamped_and_relaxed_on_reruns():
+    calibrator = TimeoutCalibrator({
+        "LoginPage.login_button:click": [100.0] * 19 + [400.0],
+        "LoginPage.error_message:to_be_visible": [10.0] * MIN_SAMPLES,
+        "LoginPage.page:to_have_url": [50.0] * (MIN_SAMPLES - 1),
+    }, factor=3.0, floor_ms=300.0, ceiling_ms=1000.0)
+
+    assert calibrator.timeout_for("LoginPage.login_button:click") == 300.0  # p95 of 20 samples is the 19th
+    assert calibrator.timeout_for("LoginPage.error_message:to_be_visible") == 300.0  # floor
+    assert calibrator.timeout_for("LoginPage.page:to_have_url") is None  # too few samples: Playwright's default
+    assert calibrator.timeout_for("CartPage.checkout:click") is None
+
+    calibrator.attempt = 3
+    assert calibrator.timeout_for("LoginPage.login_button:click") == 1000.0  # 4 x 300, capped by the ceiling
+    calibrator.apply = False
+    assert calibrator.timeout_for("LoginPage.login_button:click") is None
+
+
+def test_new_samples_roll_into_a_bounded_window():
+    calibrator = TimeoutCalibrator({"InventoryPage.products_title:to_be_visible": [1.0] * WINDOW})
+    calibrator.record("InventoryPage.products_title:to_be_visible", 2.0)
+    calibrator.merge_new_samples({"CartPage.checkout:click": [3.0, 4.0]})
+
+    samples = calibrator.updated_samples()
+    assert len(samples["InventoryPage.products_title:to_be_visible"]) == WINDOW
+    assert samples["InventoryPage.products_title:to_be_visible"][-1] == 2.0
+    assert samples["CartPage.checkout:click"] == [3.0, 4.0]
+
+
+def test_failed_calls_are_not_recorded(mocker, monkeypatch):
+    calibrator = TimeoutCalibrator()
+    monkeypatch.setattr(locator_timeouts, "_active", calibrator)
+
+    with pytest.raises(TimeoutError):
+        with locator_timeouts.calibrated("LoginPage.login_button:click", mocker.Mock(spec=Page)):
+            raise TimeoutError("Locator.click: Timeout 300ms exceeded.")
+
+    assert calibrator.new_samples == {}
+
+
+def test_page_objects_pass_calibrated_timeouts_and_record_under_one_key(mocker, monkeypatch):
+    """
+    Sync and async page objects look up and record the same 'PageClass.locator:call' key.
+    """
+    calibrator = TimeoutCalibrator({"LoginPage.login_button:click": [100.0] * MIN_SAMPLES})
+    monkeypatch.setattr(locator_timeouts, "_active", calibrator)
+    page = mocker.Mock(spec=Page)  # Passes for a real page: only those are recorded
+
+    LoginPage(page).login("standard_user", "secret_sauce")
+
+    page.locator.return_value.click.assert_called_once_with(timeout=300.0)
+    page.locator.return_value.fill.assert_called_with("secret_sauce", timeout=None)  # No samples yet: default
+    assert list(calibrator.new_samples) == ["LoginPage.username_input:fill", "LoginPage.password_input:fill",
+                                            "LoginPage.login_button:click"]
+
+
+def test_async_page_objects_share_the_calibration(mocker, monkeypatch, run_async):
+    calibrator = TimeoutCalibrator({"LoginPage.username_input:fill": [200.0] * MIN_SAMPLES})
+    monkeypatch.setattr(locator_timeouts, "_active", calibrator)
+    page = mocker.Mock(spec=AsyncPage)
+    page.locator.return_value.fill = mocker.AsyncMock()
+    page.locator.return_value.click = mocker.AsyncMock()
+
+    run_async(AsyncLoginPage(page).login("standard_user", "secret_sauce"))
+
+    page.locator.return_value.fill.assert_any_await("standard_user", timeout=600.0)
+    assert "LoginPage.username_input:fill" in calibrator.new_samples
+
+
+def test_mock_driven_page_objects_are_not_recorded(mocker, monkeypatch):
+    """
+    Unit tests drive page objects with mocks that answer instantly; as samples they would
+    shrink the calibrated timeouts of the real pages.
+    """
+    calibrator = TimeoutCalibrator({"LoginPage.login_button:click": [100.0] * MIN_SAMPLES})
+    monkeypatch.setattr(locator_timeouts, "_active", calibrator)
+    page = mocker.Mock()
+
+    LoginPage(page).login("standard_user", "secret_sauce")
+
+    page.locator.return_value.click.assert_called_once_with(timeout=300.0)  # Timeouts still apply
+    assert calibrator.new_samples == {}
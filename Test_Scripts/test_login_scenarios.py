@@ -1,8 +1,12 @@
 # tests/test_login_scenarios.py (Modified)
-import pytest
+import asyncio
+from pathlib import Path
+
 from playwright.sync_api import Page, expect
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
+from pages.async_login_page import AsyncLoginPage
+from framework.data_source import iter_cases
 
 
 def test_invalid_login_scenario_with_page_object_refactored(page: Page):
@@ -27,3 +31,27 @@ def test_successful_login_scenario_with_page_object_refactored(page: Page):
     # assert inventory_page.get_products_title_text() == "Products"
 
     print("\nSuccessful login verified using refactored Page Object Model.")
+
+
+async def _check_login_scenario(login_page: AsyncLoginPage, case: dict):
+    await login_page.navigate()
+    await login_page.login(case["username"], case["password"])
+    if case["expected_outcome"] == "success":
+        await login_page.page.wait_for_url("**/inventory.html")
+    else:
+        assert "Epic sadface" in await login_page.get_error_message_text()
+
+
+def test_login_scenarios_concurrently(new_async_pages, run_async):
+    """
+    Runs every case of data/login_scenarios.csv at the same time, as tabs of one browser.
+    """
+    cases = [case for _, case in iter_cases(Path(__file__).parent / "data" / "login_scenarios.csv")]
+
+    async def check_all():
+        async with new_async_pages(len(cases)) as pages:
+            await asyncio.gather(*(_check_login_scenario(AsyncLoginPage(page), case)
+                                   for page, case in zip(pages, cases)))
+
+    run_async(check_all())
+    print(f"\n{len(cases)} login scenarios verified concurrently.")
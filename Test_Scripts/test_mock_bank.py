@@ -0,0 +1,75 @@
+# test_mock_bank.py
+import json
+from pathlib import Path
+
+import pytest
+
+from framework.mock_bank import MockBank, MockSession
+from framework.stubs import FakeRoute
+
+API = "http://localhost:8000/api"
+
+
+@pytest.fixture
+def bank():
+    return MockBank([
+        {"method": "GET", "url": f"{API}/posts", "json": [{"id": 1}]},
+        {"method": "GET", "url": f"{API}/posts/{{id}}", "json": {"id": "${id}"}, "template": True},
+        {"method": "GET", "url": f"{API}/posts/latest", "body": "latest"},
+        {"method": "DELETE", "url": f"{API}/posts/{{id}}", "status": 204},
+        {"method": "*", "url": f"{API}/users/{{user_id}}/posts/{{id}}", "status": 202},
+    ])
+
+
+@pytest.mark.parametrize("method, url, expected_status, expected_params", [
+    ("GET", f"{API}/posts", 200, {}),
+    ("GET", f"{API}/posts?page=2", 200, {}),  # Query strings are ignored for matching
+    ("GET", f"{API}/posts/42", 200, {"id": "42"}),
+    ("DELETE", f"{API}/posts/42", 204, {"id": "42"}),
+    ("PATCH", f"{API}/users/7/posts/3", 202, {"user_id": "7", "id": "3"}),
+])
+def test_requests_are_matched_through_the_index(bank, method, url, expected_status, expected_params):
+    response, params = bank.match(method, url)
+    assert response.status == expected_status
+    assert params == expected_params
+
+
+def test_literal_segments_win_over_placeholders_and_unknown_urls_miss(bank):
+    response, params = bank.match("GET", f"{API}/posts/latest")
+    assert (response.body, params) == (b"latest", {})
+    assert bank.match("POST", f"{API}/posts/1") == (None, None)
+    assert bank.match("GET", "http://localhost:9999/api/posts") == (None, None)
+
+
+def test_conflicting_placeholder_names_are_rejected_at_load_time(bank):
+    with pytest.raises(ValueError, match=r"\{post_id\}.*\{id\}"):
+        bank.add({"method": "GET", "url": f"{API}/posts/{{post_id}}/comments", "json": {"post": "${post_id}"}})
+    bank.add({"method": "GET", "url": f"{API}/posts/{{id}}/comments", "json": {"post": "${id}"}, "template": True})
+    assert bank.match("GET", f"{API}/posts/5/comments")[1] == {"id": "5"}
+
+
+def test_session_serves_templated_bodies_overrides_and_counts_calls(bank):
+    """
+    A session renders templated bodies, prefers per-test overrides and falls back on misses.
+    """
+    session = MockSession(bank)
+    session.override("GET", f"{API}/posts", status=500, body="boom")
+
+    routes = [FakeRoute("GET", f"{API}/posts/7"), FakeRoute("GET", f"{API}/posts"),
+              FakeRoute("GET", "https://example.com/")]
+    for route in routes:
+        session.handle(route)
+
+    assert json.loads(routes[0].fulfilled["body"]) == {"id": "7"}
+    assert routes[0].fulfilled["headers"]["content-type"] == "application/json"
+    assert routes[1].fulfilled["status"] == 500
+    assert routes[2].fell_back
+    session.assert_called("GET", f"{API}/posts/{{id}}", times=1)
+    with pytest.raises(AssertionError):
+        session.assert_called("DELETE", f"{API}/posts/{{id}}")
+
+
+def test_shipped_mock_files_load():
+    bank = MockBank.load(Path(__file__).parent / "mocks")
+    response, _ = bank.match("GET", "http://localhost:8000/api/data")
+    assert json.loads(response.body) == {"message": "Data successfully mocked!"}
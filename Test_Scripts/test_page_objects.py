@@ -0,0 +1,72 @@
+# test_page_objects.py
+import pytest
+
+from framework import locator_timeouts
+from framework.stubs import StubPage
+from pages.async_cart_page import AsyncCartPage
+from pages.async_checkout_page import AsyncCheckoutPage
+from pages.async_inventory_page import AsyncInventoryPage
+from pages.async_login_page import AsyncLoginPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+
+@pytest.mark.parametrize("sync_class, async_class", [
+    (LoginPage, AsyncLoginPage),
+    (InventoryPage, AsyncInventoryPage),
+    (CartPage, AsyncCartPage),
+    (CheckoutPage, AsyncCheckoutPage),
+])
+def test_sync_and_async_page_objects_share_locators(sync_class, async_class):
+    """
+    Both flavours of a page object should build identical locators from the shared definitions.
+    """
+    page = StubPage()
+    sync_page, async_page = sync_class(page), async_class(page)
+
+    assert sync_class.locators is async_class.locators
+    for name in sync_class.locators:
+        assert getattr(sync_page, name) == getattr(async_page, name)
+    assert sync_page.page_title == ("locator", (".title",), {})
+
+
+def test_async_login_fills_credentials_and_submits(mocker, monkeypatch, run_async):
+    """
+    The async login action awaits each interaction in order on the shared locators.
+    """
+    monkeypatch.setattr(locator_timeouts, "_active", None)  # Keep the session's calibrated timeouts out
+    page = mocker.Mock()
+    login_page = AsyncLoginPage(page)
+    page.locator.return_value.fill = mocker.AsyncMock()
+    page.locator.return_value.click = mocker.AsyncMock()
+
+    run_async(login_page.login("standard_user", "secret_sauce"))
+
+    login_page.username_input.fill.assert_has_awaits([mocker.call("standard_user", timeout=None),
+                                                      mocker.call("secret_sauce", timeout=None)])
+    login_page.login_button.click.assert_awaited_once_with(timeout=None)
+
+
+def test_coroutines_run_after_sync_playwright_whatever_the_distribution(framework_pytester):
+    """
+    Sync Playwright leaves its event loop running on the main thread; run_async must not care,
+    neither in file order nor when xdist's --dist loadgroup reorders the work.
+    """
+    framework_pytester.makepyfile(
+        test_a_sync="def test_sync(playwright):\n    assert playwright.chromium.name == 'chromium'\n",
+        test_b_async="""
+from playwright.async_api import async_playwright
+
+
+def test_async(run_async):
+    async def browser_type_name():
+        async with async_playwright() as playwright:
+            return playwright.chromium.name
+
+    assert run_async(browser_type_name()) == "chromium"
+""")
+
+    framework_pytester.runpytest_subprocess().assert_outcomes(passed=2)
+    framework_pytester.runpytest_subprocess("-n", "1", "--dist", "loadgroup").assert_outcomes(passed=2)
@@ -0,0 +1,31 @@
+# test_startup_profile.py
+
+
+def test_profile_reports_collection_and_imports_of_test_modules(framework_pytester):
+    """
+    Modules imported while collecting are timed, and the finder is gone once the tests run.
+    """
+    framework_pytester.makepyfile(
+        slow_helper="import time\ntime.sleep(0.05)\n",
+        test_profiled="""
+            import sys
+
+            import slow_helper
+
+
+            def test_finder_is_removed_after_collection():
+                assert not any(type(finder).__name__ == "StartupProfilePlugin" for finder in sys.meta_path)
+        """,
+    )
+
+    result = framework_pytester.runpytest_subprocess("--startup-profile", "-p", "no:randomly")
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines([
+        "*startup profile*",
+        "collection: * ms",
+        "imports during collection: * modules, * ms",
+        "*slow_helper",
+    ])
+    slow_helper_line = next(line for line in result.outlines if line.endswith("  slow_helper"))
+    assert float(slow_helper_line.split()[0]) >= 50.0
@@ -1,10 +1,10 @@
-import pytest
 from playwright.sync_api import Page, expect
 
 # The 'page' fixture is automatically provided by pytest-playwright
 # It represents a single browser tab/page.
 
 from pages.login_page import LoginPage
+from framework.data_source import data_source
 
 
 def test_example_page_title(page: Page):
@@ -86,19 +86,13 @@ def test_successful_login_scenario(page: Page):
 
 # Basic Network Interception
 
-def test_mock_api_response(page: Page):
+def test_mock_api_response(page: Page, mock_bank):
     """
     Mocks an API response to test a UI component's behaviour without needing a real backend
     """
+    # Fulfilled locally from Test_Scripts/mocks/api.json by the mock bank, so we don't need a real backend
     mock_url = "http://localhost:8000/api/data"
 
-    # Fulfill the request locally, so we don't need a real backend
-    page.route(mock_url, lambda route: route.fulfill(
-        status=200,
-        content_type="application/json",
-        body='{"message": "Data successfully mocked!"}'
-    ))
-
     # Trigger a fetch to the mocked endpoint via injected JS
     page.goto(f"data:text/html,<script>"
               f"fetch('{mock_url}')"
@@ -109,6 +103,7 @@ def test_mock_api_response(page: Page):
 
     # Assert that the mocked data is displayed on the page
     expect(page.locator("body")).to_have_text("Data successfully mocked!")
+    mock_bank.assert_called("GET", mock_url, times=1)
     print("\nAPI response successfully mocked and verified.")
     page.screenshot(path="mocked_api_response.png")
 
@@ -146,12 +141,9 @@ def test_block_image_request(page: Page):
 #     print("\nSaucedemo login page visual test executed.")
 
 
-@pytest.mark.parametrize("username, password, expected_outcome", [
-    ("standard_user", "secret_sauce", "success"),
-    ("locked_out_user", "secret_sauce", "error"),
-    ("invalid_user", "wrong_password", "error")
-])
-def test_login_scenarios(page: Page, username, password, expected_outcome):
+@data_source("data/login_scenarios.csv", id_field="username")
+def test_login_scenarios(page: Page, data_case):
+    username, password, expected_outcome = data_case["username"], data_case["password"], data_case["expected_outcome"]
     login_page = LoginPage(page)
     login_page.navigate()
     login_page.login(username, password)
@@ -0,0 +1,87 @@
+# test_web_perf.py
+import json
+from pathlib import Path
+
+from framework import locator_timeouts, web_perf
+from framework.web_perf import WebPerfCollector, load_budgets, throttle_commands
+from pages.cart_page import CartPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+
+def test_budgets_merge_the_wildcard_and_skip_metrics_a_navigation_lacks():
+    collector = WebPerfCollector({"*": {"cls": 0.1}, "CartPage": {"duration_ms": 2000, "lcp_ms": 2500}})
+
+    violations = collector.check("CartPage", {"duration_ms": 2500.0, "lcp_ms": None, "cls": 0.25})
+
+    assert violations == ["CartPage cls 0.25 exceeds budget 0.1", "CartPage duration_ms 2500.00 exceeds budget 2000"]
+    assert collector.check("LoginPage", {"duration_ms": 9000.0, "cls": 0.0}) == []
+
+
+def test_navigations_are_recorded_per_test_and_summarised_per_page():
+    collector = WebPerfCollector({"InventoryPage": {"requests": 10}})
+    collector.start("test_a")
+    collector.record("InventoryPage", {"duration_ms": 100.0, "requests": 12, "lcp_ms": None})
+    collector.start("test_b")
+    collector.record("InventoryPage", {"duration_ms": 300.0, "requests": 8, "lcp_ms": None})
+    collector.start("test_a")  # A rerun replaces the earlier attempt's navigations
+    collector.record("InventoryPage", {"duration_ms": 200.0, "requests": 6, "lcp_ms": None})
+
+    assert [navigation["requests"] for navigation in collector.results["test_a"]] == [6]
+    assert collector.results["test_b"][0]["violations"] == []
+    summary = collector.summary()["InventoryPage"]
+    assert (summary["navigations"], summary["duration_ms"], summary["lcp_ms"]) == (2, 250.0, None)
+
+
+def test_throttling_is_only_sent_to_chromium(mocker):
+    collector = WebPerfCollector(throttle="slow-4g")
+    page = mocker.Mock()
+    page.context.browser.browser_type.name = "firefox"
+
+    assert collector.throttle_commands_for(page) == []
+    assert collector.unthrottled_browsers == {"firefox"}
+    page.context.browser.browser_type.name = "chromium"
+    assert collector.throttle_commands_for(page) == throttle_commands("slow-4g")
+
+
+def test_transitions_are_measured_and_keyed_by_the_page_they_reach(mocker, monkeypatch):
+    """
+    The init script is added once per page; each navigation is recorded under the page object it reaches.
+    """
+    collector = WebPerfCollector()
+    collector.start("test_checkout")
+    monkeypatch.setattr(web_perf, "_active", collector)
+    page = mocker.Mock()
+    page.evaluate.side_effect = lambda script, *args: {"duration_ms": 42.0} if args else {"origin": 1, "mark": 2}
+
+    inventory_page = InventoryPage(page)
+    with inventory_page.navigation(CartPage):
+        pass
+    with inventory_page.navigation():
+        pass
+
+    page.add_init_script.assert_called_once_with(web_perf.INIT_SCRIPT)
+    assert [navigation["page"] for navigation in collector.results["test_checkout"]] == ["CartPage", "InventoryPage"]
+
+
+def test_login_transition_starts_after_the_credentials_are_typed(mocker, monkeypatch):
+    collector = WebPerfCollector()
+    collector.start("test_login")
+    monkeypatch.setattr(web_perf, "_active", collector)
+    monkeypatch.setattr(locator_timeouts, "_active", None)  # Keep the session's calibration out
+    monkeypatch.setattr("pages.login_page.expect", mocker.Mock())
+    page = mocker.Mock()
+    page.evaluate.side_effect = lambda script, *args: {"duration_ms": 42.0} if args else {"origin": 1, "mark": 2}
+
+    LoginPage(page).login_successfully("standard_user", "secret_sauce")
+
+    calls = [name for name, _, _ in page.mock_calls]
+    mark = calls.index("evaluate")
+    assert calls.index("locator().click") > mark > max(i for i, name in enumerate(calls) if name == "locator().fill")
+    assert collector.results["test_login"][0]["page"] == "InventoryPage"
+
+
+def test_shipped_budgets_load():
+    budgets = load_budgets(web_perf.DEFAULT_BUDGETS)
+    assert budgets == json.loads(Path(__file__).with_name("perf_budgets.json").read_text(encoding="utf8"))
+    assert {"*", "LoginPage", "InventoryPage"} <= budgets.keys()